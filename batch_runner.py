@@ -0,0 +1,346 @@
+"""
+Job specs and the batch engine shared by the command line.
+A job is a dict (from arguments or a JSON/YAML manifest) describing one cut, extract
+or merge; BatchRunner runs many of them over a worker pool with per-disk concurrency
+limits, retries and a resumable export journal.
+"""
+import os
+import json
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import video_cutter
+import task_runner
+
+DEFAULT_OUTPUT_TEMPLATES = {
+    'cut': "{dir}/{name}_cut{ext}",
+    'extract': "{dir}/{name}_extracted{ext}",
+    'merge': "{dir}/{name}_merged{ext}",
+}
+
+class JobError(Exception):
+    pass
+
+def expand_output(template, input_path):
+    """
+    Fills an output template: {dir}, {name} and {ext} refer to the (first) input file.
+    Literal braces must be doubled ({{ and }}). Raises JobError on a bad template.
+    """
+    dir_name = os.path.dirname(os.path.abspath(input_path))
+    name, ext = os.path.splitext(os.path.basename(input_path))
+    try:
+        return os.path.normpath(template.format(dir=dir_name, name=name, ext=ext.lower() or ".mkv"))
+    except (KeyError, IndexError, ValueError, AttributeError) as e:
+        raise JobError(f"잘못된 출력 경로 템플릿: {template} ({{dir}}, {{name}}, {{ext}}만 사용 가능, 중괄호 문자는 {{{{ }}}}로 입력)")
+
+def parse_segment(value):
+    """
+    Parses a segment given as "START-END" or [START, END].
+    Returns (start_ms, end_ms).
+    """
+    if isinstance(value, str):
+        parts = value.split("-")
+    else:
+        parts = list(value)
+    if len(parts) != 2:
+        raise JobError(f"잘못된 구간: {value} (START-END 형식)")
+    try:
+        start_ms, end_ms = (video_cutter.parse_time_ms(p) for p in parts)
+    except ValueError as e:
+        raise JobError(str(e))
+    if end_ms <= start_ms:
+        raise JobError(f"잘못된 구간: {value} (끝점은 시작점보다 뒤에 있어야 합니다)")
+    return start_ms, end_ms
+
+def parse_tracks(value):
+    """
+    Parses a track selection given as "0,2,3" or [0, 2, 3]. None selects every track.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = [v for v in value.split(",") if v.strip()]
+    try:
+        return [int(v) for v in value]
+    except (TypeError, ValueError):
+        raise JobError(f"잘못된 트랙 ID 목록: {value}")
+
+def load_job_file(path, with_settings=False):
+    """
+    Reads a job file (JSON, or YAML when PyYAML is installed).
+    Accepts a list of jobs or an object with a "jobs" list; the object may also set
+    batch options ("parallel", "per_disk", "retries"), returned with with_settings=True.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if os.path.splitext(path)[1].lower() in (".yml", ".yaml"):
+            try:
+                import yaml
+            except ImportError:
+                raise JobError("YAML 작업 파일을 읽으려면 PyYAML이 필요합니다 (pip install pyyaml).")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    jobs = data.get('jobs') if isinstance(data, dict) else data
+    if not isinstance(jobs, list):
+        raise JobError(f"작업 목록을 찾을 수 없습니다: {path}")
+    if with_settings:
+        settings = {k: data[k] for k in ('parallel', 'per_disk', 'retries') if isinstance(data, dict) and k in data}
+        return jobs, settings
+    return jobs
+
+def normalize_job(job):
+    """
+    Validates a job dict and fills in defaults.
+    Keys: type (cut/extract/merge), input or inputs, segments, tracks, merge, smart_cut,
+    direct_merge, single_pass, resumable, force, output.
+    """
+    if not isinstance(job, dict):
+        raise JobError(f"잘못된 작업 항목: {job}")
+    job_type = job.get('type') or ("merge" if 'inputs' in job else "cut" if job.get('segments') else "extract")
+    if job_type not in DEFAULT_OUTPUT_TEMPLATES:
+        raise JobError(f"알 수 없는 작업 유형: {job_type}")
+
+    normalized = {'type': job_type}
+    if job_type == "merge":
+        inputs = list(job.get('inputs') or [])
+        if len(inputs) < 2:
+            raise JobError("병합 작업에는 2개 이상의 입력 파일이 필요합니다.")
+        normalized['inputs'] = inputs
+        normalized['force'] = bool(job.get('force', False))
+        first_input = inputs[0]
+    else:
+        if not job.get('input'):
+            raise JobError("입력 파일이 지정되지 않았습니다.")
+        normalized['input'] = job['input']
+        normalized['segments'] = [parse_segment(s) for s in job.get('segments') or []]
+        normalized['tracks'] = parse_tracks(job.get('tracks'))
+        normalized['merge'] = bool(job.get('merge', False))
+        normalized['smart_cut'] = bool(job.get('smart_cut', False))
+        normalized['direct_merge'] = bool(job.get('direct_merge', True))
+        normalized['single_pass'] = bool(job.get('single_pass', False))
+        normalized['resumable'] = bool(job.get('resumable', False))
+        if job_type == "cut" and not normalized['segments']:
+            raise JobError("자르기 작업에는 하나 이상의 구간이 필요합니다.")
+        first_input = job['input']
+
+    normalized['output'] = expand_output(job.get('output') or DEFAULT_OUTPUT_TEMPLATES[job_type], first_input)
+    return normalized
+
+def build_job_tasks(job):
+    """
+    Returns (tasks, temp_files, warning) for a normalized job. Raises JobError.
+    """
+    output_dir = os.path.dirname(job['output'])
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    if job['type'] == "merge":
+        missing = [f for f in job['inputs'] if not os.path.exists(f)]
+        if missing:
+            raise JobError(f"입력 파일이 없습니다: {', '.join(missing)}")
+        if not job['force']:
+            probes = video_cutter.probe_many(job['inputs'])
+            report = video_cutter.check_concat_compatibility(job['inputs'], probes)
+            if report['verdict'] != video_cutter.CONCAT_COPY:
+                lines = [f"  [{f['verdict']}] {f['path']}: {'; '.join(f['issues'])}"
+                         for f in report['files'] if f['issues']]
+                raise JobError("무손실 병합 사전 검사 실패 (--force로 무시 가능):\n" + "\n".join(lines))
+        tasks, error = video_cutter.build_merge_tasks(job['inputs'], job['output'])
+        if not tasks:
+            raise JobError(error)
+        return tasks, [], None
+
+    input_path = job['input']
+    if not os.path.exists(input_path):
+        raise JobError(f"입력 파일이 없습니다: {input_path}")
+    segments = job['segments']
+    keyframes = None
+    if segments:
+        keyframes = video_cutter.get_keyframes(input_path)
+    else:
+        duration_ms = video_cutter.get_media_duration_ms(input_path)
+        if duration_ms <= 0:
+            raise JobError(f"영상 길이를 읽을 수 없습니다: {input_path}")
+        segments = [(0, duration_ms)]
+
+    tasks, temp_files, message = video_cutter.build_export_tasks(
+        input_path, segments, job['output'], job['tracks'],
+        merge=job['merge'], keyframes=keyframes,
+        smart_cut=job['smart_cut'] and bool(job['segments']),
+        direct_merge=job['direct_merge'],
+        single_pass=job['single_pass'],
+        resumable=job['resumable']
+    )
+    if not tasks:
+        raise JobError(message)
+    return tasks, temp_files, message
+
+def remove_files(paths):
+    for path in paths:
+        if os.path.exists(path):
+            try: os.remove(path)
+            except OSError: pass
+
+class DiskLimiter:
+    """
+    Caps how many jobs touch the same storage device at once, so a whole library is
+    spread over every disk instead of thrashing one. A job holds a slot on the device
+    of each source and of its output folder; slots are taken in device order so two
+    jobs never wait on each other.
+    """
+    def __init__(self, per_disk=None):
+        self.per_disk = per_disk
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    @staticmethod
+    def device_of(path):
+        path = os.path.abspath(path)
+        while not os.path.exists(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                return None
+            path = parent
+        try:
+            return os.stat(path).st_dev
+        except OSError:
+            return None
+
+    def _semaphore(self, device, path):
+        with self._lock:
+            if device not in self._semaphores:
+                # Spinning disks get 2 slots, SSDs a few more (see default_worker_count)
+                limit = self.per_disk or task_runner.default_worker_count(path)
+                self._semaphores[device] = threading.BoundedSemaphore(max(1, limit))
+            return self._semaphores[device]
+
+    @contextmanager
+    def slots(self, paths, cancel_event=None):
+        """Holds one slot per device of paths. Yields False if cancelled while waiting."""
+        devices = {}
+        for path in paths:
+            device = self.device_of(path)
+            if device is not None:
+                devices.setdefault(device, path)
+        acquired = []
+        try:
+            for device in sorted(devices):
+                semaphore = self._semaphore(device, devices[device])
+                while not semaphore.acquire(timeout=0.2):
+                    if cancel_event is not None and cancel_event.is_set():
+                        yield False
+                        return
+                acquired.append(semaphore)
+            yield True
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+class BatchRunner:
+    """
+    Runs a manifest of jobs concurrently.
+    - Jobs are spread over max_parallel workers, gated by DiskLimiter.
+    - Each job runs through a TaskRunner with task_workers ffmpeg processes.
+    - A failed job is retried up to `retries` times. With a journal, tasks that
+      already finished (in this run or an earlier, interrupted one) are skipped,
+      so a retry or a rerun of the same manifest only redoes what is missing.
+    on_event(job_index, kind, message) reports "start", "warning", "retry", "done" and "failed"
+    with a text message, and "progress" with {'percent': int, 'stats': TaskRunner stats dict or None}.
+    """
+    def __init__(self, jobs, journal=None, max_parallel=8, per_disk=None, retries=1,
+                 retry_delay=5.0, task_workers=1, on_event=None):
+        self.jobs = jobs
+        self.journal = journal
+        self.max_parallel = max(1, max_parallel)
+        self.limiter = DiskLimiter(per_disk)
+        self.retries = max(0, retries)
+        self.retry_delay = retry_delay
+        self.task_workers = task_workers
+        self.on_event = on_event
+        self.cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._runners = set()
+
+    def _emit(self, index, kind, message=""):
+        if self.on_event:
+            self.on_event(index, kind, message)
+
+    def run(self):
+        """
+        Runs every job. Returns a list of (success, message) in manifest order.
+        """
+        if not self.jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(self.jobs)), thread_name_prefix="batch") as pool:
+            return list(pool.map(self._run_job, range(len(self.jobs))))
+
+    def _run_job(self, index):
+        if self.cancel_event.is_set():
+            return False, "사용자에 의해 취소됨"
+        try:
+            job = normalize_job(self.jobs[index])
+        except JobError as e:
+            self._emit(index, "failed", str(e))
+            return False, str(e)
+
+        sources = job['inputs'] if job['type'] == "merge" else [job['input']]
+        msg = "사용자에 의해 취소됨"
+        with self.limiter.slots(sources + [job['output']], self.cancel_event) as acquired:
+            if not acquired:
+                return False, msg
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    self._emit(index, "retry", f"{attempt}/{self.retries} ({msg})")
+                    if self.cancel_event.wait(self.retry_delay):
+                        break
+                self._emit(index, "start", job['output'])
+                try:
+                    tasks, temp_files, warning = build_job_tasks(job)
+                except JobError as e:
+                    msg = str(e)
+                    break # Bad job spec or missing input; retrying won't help
+                except OSError as e:
+                    msg = str(e)
+                    continue
+                if warning:
+                    self._emit(index, "warning", warning)
+
+                progress = {'percent': 0, 'stats': None}
+
+                def on_progress(percent):
+                    progress['percent'] = percent
+                    self._emit(index, "progress", dict(progress))
+
+                def on_stats(stats):
+                    progress['stats'] = stats
+                    self._emit(index, "progress", dict(progress))
+
+                runner = task_runner.TaskRunner(tasks, self.task_workers, on_progress=on_progress,
+                                                journal=self.journal, on_stats=on_stats)
+                with self._lock:
+                    self._runners.add(runner)
+                if self.cancel_event.is_set():
+                    runner.cancel()
+                try:
+                    success, generated_files, msg = runner.run()
+                finally:
+                    with self._lock:
+                        self._runners.discard(runner)
+                # Finished task outputs stay for the journal; only partial files go
+                remove_files(runner.failed_outputs)
+                if success:
+                    remove_files(temp_files)
+                    self._emit(index, "done", job['output'])
+                    return True, msg
+                if self.cancel_event.is_set():
+                    break
+
+        self._emit(index, "failed", msg)
+        return False, msg
+
+    def cancel(self):
+        self.cancel_event.set()
+        with self._lock:
+            runners = list(self._runners)
+        for runner in runners:
+            runner.cancel()
@@ -0,0 +1,215 @@
+"""
+Headless command line for cut / extract / merge jobs.
+Runs the same task pipeline as the GUI export (video_cutter + task_runner),
+without PySide6, mpv or a display.
+
+  python cli.py cut input.mkv -s 00:01:00-00:02:30 -s 00:10:00-00:12:00 --merge -o out.mkv
+  python cli.py extract input.mkv -t 0,2 -o tracks.mka
+  python cli.py merge a.mkv b.mkv c.mkv -o merged.mkv
+  python cli.py run jobs.json --parallel 4 --per-disk 2
+"""
+import sys
+import argparse
+import threading
+
+import task_runner
+import export_journal
+from batch_runner import (DEFAULT_OUTPUT_TEMPLATES, JobError, BatchRunner, load_job_file,
+                          normalize_job, build_job_tasks, remove_files)
+
+def format_stats(stats):
+    """Formats TaskRunner stats as '  12.3 MB  4.5 MB/s  2.1x  ETA 1:05'."""
+    details = f"  {stats['bytes'] / (1024 * 1024):.1f} MB  {stats['throughput'] / (1024 * 1024):.1f} MB/s"
+    if stats['speed']:
+        details += f"  {stats['speed']:.1f}x"
+    if stats['eta'] is not None:
+        details += f"  ETA {int(stats['eta']) // 60}:{int(stats['eta']) % 60:02d}"
+    return details
+
+def run_tasks(tasks, max_workers=None, label="", quiet=False):
+    """
+    Runs tasks with a TaskRunner on a worker thread so Ctrl+C cancels cleanly.
+    Returns (success, generated_files, msg).
+    """
+    state = {'percent': 0, 'details': ""}
+
+    def show():
+        if not quiet:
+            print(f"\r{label}{state['percent']:3d}%{state['details']}\033[K", end="", file=sys.stderr, flush=True)
+
+    def on_progress(percent):
+        state['percent'] = percent
+        show()
+
+    def on_stats(stats):
+        state['details'] = format_stats(stats)
+        show()
+
+    def on_log(desc):
+        if not quiet:
+            print(f"\r{label}{desc}", file=sys.stderr, flush=True)
+
+    runner = task_runner.TaskRunner(tasks, max_workers, on_progress=on_progress, on_log=on_log, on_stats=on_stats)
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=runner.run()), daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(0.2)
+    except KeyboardInterrupt:
+        runner.cancel()
+        thread.join()
+    if not quiet:
+        print(file=sys.stderr)
+    return result.get('value', (False, [], "사용자에 의해 취소됨"))
+
+def run_job(job, label="", max_workers=None, quiet=False):
+    """
+    Builds and runs one job, removing partial outputs on failure. Returns True on success.
+    """
+    try:
+        job = normalize_job(job)
+        tasks, temp_files, warning = build_job_tasks(job)
+    except (JobError, OSError) as e:
+        print(f"{label}Error: {e}", file=sys.stderr)
+        return False
+    if warning:
+        print(f"{label}Warning: {warning}", file=sys.stderr)
+
+    success, generated_files, msg = run_tasks(tasks, max_workers, label, quiet)
+    if success:
+        remove_files(temp_files)
+        print(f"{label}{msg}: {job['output']}")
+    else:
+        remove_files(generated_files + temp_files)
+        print(f"{label}Error: {msg}", file=sys.stderr)
+    return success
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="MKV 무손실 자르기/추출/병합 (GUI 없이 실행)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="작업당 동시에 실행할 ffmpeg 프로세스 수 (기본: 자동)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="진행 상황을 출력하지 않음")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    cut = sub.add_parser("cut", help="구간 자르기")
+    cut.add_argument("input")
+    cut.add_argument("-s", "--segment", action="append", required=True, help="START-END (초, [HH:]MM:SS[.mmm] 또는 <n>ms), 여러 번 지정 가능")
+    cut.add_argument("-t", "--tracks", help="내보낼 트랙 ID (예: 0,1,3). 생략 시 전체")
+    cut.add_argument("--merge", action="store_true", help="여러 구간을 하나의 파일로 병합")
+    cut.add_argument("--smart-cut", action="store_true", help="경계 GOP만 재인코딩하여 프레임 단위로 정확하게 자르기")
+    cut.add_argument("-o", "--output", help=f"출력 경로 또는 템플릿 (기본: {DEFAULT_OUTPUT_TEMPLATES['cut']})")
+
+    extract = sub.add_parser("extract", help="트랙 추출 (전체 길이)")
+    extract.add_argument("input")
+    extract.add_argument("-t", "--tracks", required=True, help="추출할 트랙 ID (예: 1,2)")
+    extract.add_argument("-o", "--output", help=f"출력 경로 또는 템플릿 (기본: {DEFAULT_OUTPUT_TEMPLATES['extract']})")
+
+    merge = sub.add_parser("merge", help="여러 파일 병합")
+    merge.add_argument("inputs", nargs="+")
+    merge.add_argument("--force", action="store_true", help="무손실 병합 사전 검사 실패를 무시")
+    merge.add_argument("-o", "--output", help=f"출력 경로 또는 템플릿 (기본: {DEFAULT_OUTPUT_TEMPLATES['merge']})")
+
+    run = sub.add_parser("run", help="작업 파일(JSON/YAML)의 작업을 병렬로 일괄 실행")
+    run.add_argument("job_file")
+    run.add_argument("--parallel", type=int, default=None, help="동시에 실행할 작업 수 (기본: 작업 파일 설정 또는 8)")
+    run.add_argument("--per-disk", type=int, default=None, help="디스크당 동시 작업 수 (기본: HDD 2, SSD 최대 4)")
+    run.add_argument("--retries", type=int, default=None, help="실패한 작업의 재시도 횟수 (기본: 1)")
+    run.add_argument("--retry-delay", type=float, default=5.0, help="재시도 전 대기 시간(초)")
+    run.add_argument("--journal", help="완료된 작업 기록 파일 (기본: <작업 파일>.journal)")
+    run.add_argument("--no-journal", action="store_true", help="기록 파일 없이 모든 작업을 처음부터 실행")
+    run.add_argument("--stop-on-error", action="store_true", help="작업 하나가 최종 실패하면 남은 작업을 취소")
+    return parser
+
+def run_batch(args):
+    """
+    Runs a job file through BatchRunner. Completed tasks are journaled next to the
+    job file, so rerunning the same command after a crash or Ctrl+C resumes.
+    """
+    try:
+        jobs, settings = load_job_file(args.job_file, with_settings=True)
+    except (OSError, ValueError, JobError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    journal = None
+    if not args.no_journal:
+        journal = export_journal.ExportJournal(args.journal or args.job_file + ".journal")
+        if len(journal):
+            print(f"기록 파일에서 완료된 작업 {len(journal)}개를 찾았습니다: {journal.path}", file=sys.stderr)
+
+    total = len(jobs)
+    runner = None
+    active = {} # job index -> progress line of the running jobs
+    print_lock = threading.Lock()
+
+    def show_progress():
+        if not args.quiet and active:
+            line = " | ".join(f"[{i+1}/{total}] {active[i]}" for i in sorted(active))
+            print(f"\r{line}\033[K", end="", file=sys.stderr, flush=True)
+
+    def on_event(index, kind, message):
+        label = f"[{index+1}/{total}] "
+        with print_lock:
+            if kind == "progress":
+                stats = message['stats']
+                active[index] = f"{message['percent']:3d}%" + (format_stats(stats) if stats else "")
+                show_progress()
+                return
+            if not args.quiet and active:
+                print("\r\033[K", end="", file=sys.stderr)
+            if kind in ("done", "failed"):
+                active.pop(index, None)
+            if kind == "done":
+                print(f"{label}완료: {message}")
+            elif kind == "failed":
+                print(f"{label}Error: {message}", file=sys.stderr)
+            elif not args.quiet:
+                names = {'start': "시작", 'warning': "Warning", 'retry': "재시도"}
+                print(f"{label}{names.get(kind, kind)}: {message}", file=sys.stderr)
+            show_progress()
+        if kind == "failed" and args.stop_on_error:
+            runner.cancel()
+
+    runner = BatchRunner(
+        jobs, journal=journal,
+        max_parallel=args.parallel or settings.get('parallel', 8),
+        per_disk=args.per_disk or settings.get('per_disk'),
+        retries=args.retries if args.retries is not None else settings.get('retries', 1),
+        retry_delay=args.retry_delay,
+        task_workers=args.jobs or 1,
+        on_event=on_event
+    )
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(value=runner.run()), daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(0.2)
+    except KeyboardInterrupt:
+        print("취소 중... 완료된 작업은 다음 실행 시 건너뜁니다.", file=sys.stderr)
+        runner.cancel()
+        thread.join()
+
+    results = result.get('value', [])
+    failed = total - sum(1 for success, msg in results if success)
+    print(f"{total - failed}/{total}개 작업 완료", file=sys.stderr)
+    if journal is not None and not failed:
+        journal.discard()
+    return 1 if failed else 0
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "run":
+        return run_batch(args)
+
+    if args.command == "merge":
+        job = {'type': "merge", 'inputs': args.inputs, 'force': args.force, 'output': args.output}
+    else:
+        job = {'type': args.command, 'input': args.input, 'tracks': args.tracks, 'output': args.output}
+        if args.command == "cut":
+            job.update(segments=args.segment, merge=args.merge, smart_cut=args.smart_cut)
+    return 0 if run_job(job, "", args.jobs, args.quiet) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
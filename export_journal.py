@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+CHECKSUM_CHUNK = 1024 * 1024 # Bytes hashed from each end of a file
+
+def partial_checksum(path):
+    """
+    Returns a quick fingerprint of a (possibly multi-GB) file: sha1 of its size plus
+    the first and last megabyte. Enough to notice a truncated or replaced output
+    without reading the whole file. Returns None if the file cannot be read.
+    """
+    try:
+        size = os.path.getsize(path)
+        digest = hashlib.sha1(str(size).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read(CHECKSUM_CHUNK))
+            if size > CHECKSUM_CHUNK:
+                f.seek(max(CHECKSUM_CHUNK, size - CHECKSUM_CHUNK))
+                digest.update(f.read(CHECKSUM_CHUNK))
+        return digest.hexdigest()
+    except OSError:
+        return None
+
+def task_key(task):
+    """
+    Identifies a task by its ffmpeg command line, which already contains the source,
+    the time range, the track maps and the output paths.
+    """
+    return hashlib.sha1(json.dumps(task['cmd'], ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def journal_path_for(output_path):
+    """Journal file kept next to an export's output while it is in progress."""
+    return output_path + ".journal"
+
+class ExportJournal:
+    """
+    Append-only JSON-lines log of finished export tasks, flushed after every record.
+    A task counts as done on resume only if every output it recorded still exists
+    with the same size and partial checksum, so a half-written or replaced file is redone.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._records = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        self._records[record['key']] = record
+                    except (ValueError, KeyError, TypeError):
+                        continue # A line cut short by a crash
+        except OSError:
+            pass
+
+    def __len__(self):
+        return len(self._records)
+
+    def is_done(self, task, outputs):
+        with self._lock:
+            record = self._records.get(task_key(task))
+        if not record:
+            return False
+        recorded = {o['path']: o for o in record.get('outputs', [])}
+        if set(recorded) != set(outputs):
+            return False
+        for path in outputs:
+            try:
+                if os.path.getsize(path) != recorded[path]['size']:
+                    return False
+            except OSError:
+                return False
+            if partial_checksum(path) != recorded[path]['checksum']:
+                return False
+        return True
+
+    def record(self, task, outputs, desc=None):
+        entry = {
+            'key': task_key(task),
+            'desc': desc or task.get('desc', ''),
+            'time': time.time(),
+            'outputs': [
+                {'path': path, 'size': os.path.getsize(path), 'checksum': partial_checksum(path)}
+                for path in outputs if os.path.exists(path)
+            ]
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._records[entry['key']] = entry
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                print(f"Error writing export journal: {e}")
+
+    def discard(self):
+        """Deletes the journal once the whole export has finished."""
+        with self._lock:
+            self._records = {}
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
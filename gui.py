@@ -3,18 +3,21 @@ import os
 import ctypes
 import cv2
 import queue
-import re
 import time
 import subprocess
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                               QHBoxLayout, QPushButton, QSlider, QLabel, QFileDialog, QMessageBox, QStyle, QStyleOptionSlider, QListWidget, QListWidgetItem, QAbstractItemView,
+                               QHBoxLayout, QPushButton, QSlider, QLabel, QFileDialog, QMessageBox, QStyle, QStyleOptionSlider, QAbstractItemView, QListView, QStyledItemDelegate, QStyleOptionViewItem,
                                QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox, QComboBox, QFrame, QProgressDialog, QMenu, QStatusBar)
 import mpv
-from PySide6.QtCore import Qt, QUrl, QTime, QPoint, Signal, QObject, QEvent, QSize, QTimer, QThread
+from PySide6.QtCore import Qt, QUrl, QTime, QPoint, QPointF, QRect, Signal, QObject, QEvent, QSize, QTimer, QThread, QAbstractListModel, QModelIndex, QPersistentModelIndex
 
 import video_cutter
+import task_runner
+import export_journal
+import media_cache
+from segment_model import SegmentModel
 
-from PySide6.QtGui import QPainter, QColor, QPolygon, QPen, QBrush, QIcon, QShortcut, QKeySequence, QPixmap, QImage, QCursor
+from PySide6.QtGui import QPainter, QColor, QPolygon, QPen, QBrush, QIcon, QShortcut, QKeySequence, QPixmap, QImage, QCursor, QPalette
 
 class ElidedLabel(QLabel):
     def __init__(self, text, parent=None):
@@ -39,6 +42,7 @@ class ElidedLabel(QLabel):
         painter.end()
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
 class ThumbnailGrabberThread(QObject):
     thumbnail_ready = Signal(int, bytes)  # emits (msec, raw_jpeg_bytes)
 
@@ -48,20 +52,140 @@ class ThumbnailGrabberThread(QObject):
         self.request_queue = queue.Queue()
         self.running = True
         self.current_video_path = ""
-        self.cap = None
+        self.cap = None # Long-lived decoder for current_video_path
+        self._cap_path = None
+        self.keyframes = (None, []) # (video_path, keyframes_ms) for the fast mode
+        self.stats = {'requests': 0, 'dropped': 0, 'preempted': 0, 'cache_hits': 0, 'completed': 0}
+        self._stats_lock = threading.Lock()
+        self.cache = media_cache.ThumbnailCache()
         self.thread = threading.Thread(target=self.run, daemon=True)
 
     def start(self):
         self.thread.start()
 
-    def request_thumbnail(self, video_path, time_msec):
+    def set_keyframes(self, video_path, keyframes):
+        self.keyframes = (video_path, keyframes)
+
+    def request_thumbnail(self, video_path, time_msec, exact=True):
+        # exact=False: fast keyframe-only preview while scrubbing, upgraded later by an exact request
         # Only keep the latest request to avoid lagging behind mouse movement
         while not self.request_queue.empty():
             try:
-                self.request_queue.get_nowait()
+                if self.request_queue.get_nowait():
+                    self._count("dropped")
             except queue.Empty:
                 break
-        self.request_queue.put((video_path, time_msec))
+        if video_path is not None:
+            self._count("requests")
+        self.request_queue.put((video_path, time_msec, exact))
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def get_stats(self, reset=False):
+        """Returns a snapshot of the request counters (requests, dropped, preempted, cache_hits, completed)."""
+        with self._stats_lock:
+            snapshot = dict(self.stats)
+            if reset:
+                for name in self.stats:
+                    self.stats[name] = 0
+            return snapshot
+
+    def log_stats(self, video_path):
+        # 파일을 닫을 때 해당 파일의 썸네일 요청 통계를 디버그 로그로 남기고 카운터를 초기화
+        stats = self.get_stats(reset=True)
+        if not stats['requests']:
+            return
+        print(f"Thumbnail stats ({os.path.basename(video_path or '')}): "
+              f"requests={stats['requests']}, dropped={stats['dropped']}, preempted={stats['preempted']}, "
+              f"cache_hits={stats['cache_hits']}, completed={stats['completed']}")
+
+    def _has_newer_request(self):
+        return not self.running or not self.request_queue.empty()
+
+    def close_file(self):
+        # Release the decoder so the source file isn't held open (and locked on Windows)
+        self.request_thumbnail(None, None)
+        self.keyframes = (None, [])
+
+    def _open_capture(self, video_path):
+        """Returns a VideoCapture kept open on video_path, reusing it across requests."""
+        if self._cap_path == video_path:
+            return self.cap
+        self._release_capture()
+        self._cap_path = video_path
+        try:
+            cap = cv2.VideoCapture(video_path)
+            if cap.isOpened():
+                self.cap = cap
+            else:
+                cap.release()
+        except Exception:
+            self.cap = None
+        return self.cap
+
+    def _release_capture(self):
+        if self.cap is not None:
+            try: self.cap.release()
+            except: pass
+        self.cap = None
+        self._cap_path = None
+
+    def _grab_with_capture(self, video_path, time_msec):
+        """Decodes one frame with the long-lived in-process decoder. Returns JPEG bytes or None."""
+        cap = self._open_capture(video_path)
+        if cap is None:
+            return None
+        cap.set(cv2.CAP_PROP_POS_MSEC, time_msec)
+        ok, frame = cap.read()
+        if not ok or frame is None:
+            return None
+        h, w = frame.shape[:2]
+        if w <= 0 or h <= 0:
+            return None
+        new_h = max(2, int(h * 288 / w) // 2 * 2)
+        frame = cv2.resize(frame, (288, new_h), interpolation=cv2.INTER_AREA)
+        ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 75])
+        return buf.tobytes() if ok else None
+
+    def _grab_with_ffmpeg(self, video_path, time_msec, creation_flags, exact=True):
+        """Fallback for files OpenCV can't open: one ffmpeg process per request."""
+        cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "quiet"]
+        if not exact:
+            # Output the keyframe before the position without decoding up to it
+            cmd.extend(["-skip_frame", "nokey", "-noaccurate_seek"])
+        cmd.extend([
+            "-ss", f"{time_msec / 1000.0:.6f}", # Seeking before input is fastest; keyframe times need µs
+            "-i", video_path,
+            "-vframes", "1",
+            "-an", "-sn", # Disable audio and subtitles for speed
+            "-q:v", "8", # Slightly lower quality for much faster encoding
+            "-vf", "scale=288:-2",
+            "-f", "image2pipe",
+            "-vcodec", "mjpeg",
+            "-"
+        ])
+        
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, creationflags=creation_flags)
+        deadline = time.monotonic() + 2 # Timeout to prevent hanging
+        while True:
+            try:
+                stdout, _ = proc.communicate(timeout=0.02)
+                break
+            except subprocess.TimeoutExpired:
+                preempted = self._has_newer_request()
+                if preempted or time.monotonic() > deadline:
+                    # A newer hover position arrived: abort this decode so it can start immediately
+                    proc.kill()
+                    proc.communicate()
+                    if preempted:
+                        self._count("preempted")
+                    return None
+        
+        if proc.returncode == 0 and stdout:
+            return stdout
+        return None
 
     def run(self):
         import subprocess
@@ -72,8 +196,6 @@ class ThumbnailGrabberThread(QObject):
         if sys.platform == "win32":
             creation_flags = subprocess.CREATE_NO_WINDOW
             
-        current_proc = None
-        
         while self.running:
             try:
                 # Wait for a request
@@ -84,46 +206,232 @@ class ThumbnailGrabberThread(QObject):
                 # This naturally limits the extraction rate to FFmpeg's speed without lagging behind
                 while not self.request_queue.empty():
                     try:
-                        item = self.request_queue.get_nowait()
+                        newer = self.request_queue.get_nowait()
                     except queue.Empty:
                         break
+                    if item and item[0] is not None:
+                        self._count("dropped")
+                    item = newer
                         
                 if not item: continue
-                video_path, time_msec = item
+                video_path, time_msec, exact = item
+                if video_path is None:
+                    self._release_capture()
+                    continue
                 self.current_video_path = video_path
 
-                # Optimized thumbnail extraction
-                cmd = [
-                    "ffmpeg", "-y", "-hide_banner", "-loglevel", "quiet",
-                    "-ss", f"{time_msec / 1000.0:.3f}", # Seeking before input is fastest
-                    "-i", video_path,
-                    "-vframes", "1",
-                    "-an", "-sn", # Disable audio and subtitles for speed
-                    "-q:v", "8", # Slightly lower quality for much faster encoding
-                    "-vf", "scale=288:-2",
-                    "-f", "image2pipe",
-                    "-vcodec", "mjpeg",
-                    "-"
-                ]
+                time_msec = self.cache.quantize(time_msec)
+                frame_msec = time_msec
+                kf_path, keyframes = self.keyframes
+                if not exact and kf_path == video_path and keyframes:
+                    # Fast mode: show the keyframe itself, which decodes without any frames before it
+                    frame_msec = video_cutter.snap_to_keyframe(keyframes, time_msec, "before")
+
+                # Serve from the LRU/disk cache before paying for a decode
+                cached = self.cache.get(video_path, frame_msec)
+                if cached:
+                    self._count("cache_hits")
+                    self.thumbnail_ready.emit(time_msec, cached)
+                    continue
+
+                # Decoder stays open across requests: no process launch, container open or probe per hover
+                data = self._grab_with_capture(video_path, frame_msec)
+                if data is None:
+                    data = self._grab_with_ffmpeg(video_path, frame_msec, creation_flags, exact)
                 
-                proc = subprocess.run(cmd, capture_output=True, creationflags=creation_flags, timeout=2) # Add timeout to prevent hanging
-                
-                if proc.returncode == 0 and proc.stdout:
-                    # Emit raw bytes to GUI thread safely!
-                    self.thumbnail_ready.emit(time_msec, proc.stdout)
+                if data:
+                    if self._has_newer_request():
+                        # The in-process decode can't be interrupted; abandon its result instead
+                        self._count("preempted")
+                    else:
+                        self._count("completed")
+                        # Emit raw bytes to GUI thread safely!
+                        self.thumbnail_ready.emit(time_msec, data)
+                    if exact or frame_msec != time_msec:
+                        # A keyframe is an exact frame at its own timestamp; a skip_frame seek result is not
+                        self.cache.put(video_path, frame_msec, data)
             
             except queue.Empty:
                 continue
             except Exception as e:
                 pass # Silently drop thumbnailing errors so it doesn't crash user terminal
 
+        # The decoder is only touched from this thread, so release it here
+        self._release_capture()
+
     def stop(self):
         self.running = False
         self.request_queue.put(None)  # Unblock the queue if it's waiting
         # PySide6 C++ thread warning bypassed via daemon python thread
-        if self.cap:
-            try: self.cap.release()
-            except: pass
+
+class KeyframeIndexThread(QObject):
+    index_ready = Signal(str, list)  # emits (video_path, keyframes_ms)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("KeyframeIndexThread")
+        self.cancel_event = threading.Event()
+        self.thread = None
+
+    def request_index(self, video_path):
+        # A new file supersedes any scan still running for the previous one
+        self.cancel()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(video_path, self.cancel_event), daemon=True)
+        self.thread.start()
+
+    def run(self, video_path, cancel_event):
+        try:
+            keyframes = video_cutter.get_keyframes(video_path, cancel_event=cancel_event)
+        except Exception:
+            keyframes = []
+        if not cancel_event.is_set():
+            self.index_ready.emit(video_path, keyframes)
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def stop(self):
+        self.cancel()
+
+class SpriteSheetThread(QObject):
+    sprite_ready = Signal(str, dict, bytes)  # emits (video_path, meta, jpeg_bytes)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("SpriteSheetThread")
+        self.cancel_event = threading.Event()
+        self.thread = None
+        self.process = None
+
+    def request_sprite(self, video_path):
+        self.cancel()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(video_path, self.cancel_event), daemon=True)
+        self.thread.start()
+
+    def run(self, video_path, cancel_event):
+        try:
+            meta, data = video_cutter.get_sprite_sheet(video_path, cancel_event, on_process=self._set_process)
+        except Exception:
+            meta, data = None, None
+        if meta and data and not cancel_event.is_set():
+            self.sprite_ready.emit(video_path, meta, data)
+
+    def _set_process(self, process):
+        self.process = process
+        if self.cancel_event.is_set():
+            self.kill_process()
+
+    def kill_process(self):
+        process = self.process
+        if process is not None and process.poll() is None:
+            try:
+                process.kill()
+            except:
+                pass
+
+    def cancel(self):
+        self.cancel_event.set()
+        self.kill_process()
+
+    def stop(self):
+        self.cancel()
+
+class ProbeService(QObject):
+    """
+    Runs ffprobe (through the probe cache) on a small thread pool off the GUI thread.
+    A new request supersedes the previous one: its ffprobe is killed and its result dropped,
+    so switching files quickly never fills the track table with a stale probe.
+    """
+    probe_ready = Signal(str, object)  # emits (file_path, probe dict or None)
+    batch_progress = Signal(int, int)  # emits (done, total)
+    batch_ready = Signal(list, list)  # emits (file_paths, probes)
+
+    def __init__(self, max_workers=2, parent=None):
+        super().__init__(parent)
+        self.setObjectName("ProbeService")
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="probe")
+        self.cancel_event = threading.Event()
+        self.future = None
+        self.batch_cancel_event = threading.Event()
+
+    def request_probe(self, file_path):
+        self.cancel()
+        self.cancel_event = threading.Event()
+        self.future = self.pool.submit(self.run, file_path, self.cancel_event)
+
+    def run(self, file_path, cancel_event):
+        try:
+            probe = video_cutter.probe_media(file_path, cancel_event=cancel_event, timeout=30)
+        except Exception:
+            probe = None
+        if not cancel_event.is_set():
+            self.probe_ready.emit(file_path, probe)
+
+    def request_batch(self, file_paths):
+        """Probes a whole merge queue concurrently; supersedes any batch still running."""
+        self.cancel_batch()
+        self.batch_cancel_event = threading.Event()
+        threading.Thread(target=self.run_batch, args=(list(file_paths), self.batch_cancel_event), daemon=True).start()
+
+    def run_batch(self, file_paths, cancel_event):
+        def on_progress(done, total):
+            if not cancel_event.is_set():
+                self.batch_progress.emit(done, total)
+        try:
+            probes = video_cutter.probe_many(file_paths, cancel_event=cancel_event, on_progress=on_progress)
+        except Exception:
+            probes = [None] * len(file_paths)
+        if not cancel_event.is_set():
+            self.batch_ready.emit(file_paths, probes)
+
+    def cancel(self):
+        self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel() # Not started yet: never runs
+            self.future = None
+
+    def cancel_batch(self):
+        self.batch_cancel_event.set()
+
+    def stop(self):
+        self.cancel()
+        self.cancel_batch()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+class MpvPropertyBridge(QObject):
+    """
+    Marshals mpv property observer callbacks (called on mpv's event thread) to the Qt thread.
+    Changes are coalesced: only the latest value per property is kept and at most one
+    delivery is queued at a time, so a burst of updates costs a single GUI pass.
+    """
+    changed = Signal()
+
+    def __init__(self, player, names, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._values = {}
+        self._pending = False
+        for name in names:
+            player.observe_property(name, self._on_property)
+
+    def _on_property(self, name, value):
+        with self._lock:
+            self._values[name] = value
+            if self._pending:
+                return
+            self._pending = True
+        # Emitted from a foreign thread, so Qt queues the delivery to the receiver's thread
+        self.changed.emit()
+
+    def take(self):
+        """Returns and clears the changed values since the last call."""
+        with self._lock:
+            values = self._values
+            self._values = {}
+            self._pending = False
+        return values
 
 class ThumbnailTooltip(QWidget):
     def __init__(self, parent=None):
@@ -167,129 +475,309 @@ class ThumbnailTooltip(QWidget):
         self.img_label.setPixmap(pixmap)
         self.time_label.setText(time_str)
 
-class MergeItemWidget(QWidget):
-    def __init__(self, text, item, main_window):
-        super().__init__()
-        self.item = item
-        self.main_window = main_window
-        self._last_click_time = 0
-        
-        layout = QHBoxLayout()
-        layout.setContentsMargins(5, 3, 5, 3)
-        
-        self.label = ElidedLabel(text)
-        self.label.setStyleSheet("background: transparent;")
-        
-        from PySide6.QtWidgets import QSizePolicy
-        self.label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        
-        layout.addWidget(self.label, 1) # Stretch factor 1
-        
-        import os
-        assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets").replace("\\", "/")
-        
-        up_style = f"QPushButton {{ background: transparent; border: none; border-image: url({assets_dir}/list_up.svg); }} QPushButton:hover {{ border-image: url({assets_dir}/list_up_hover.svg); }} QPushButton:pressed {{ border-image: url({assets_dir}/list_up.svg); }} QPushButton:disabled {{ border-image: url({assets_dir}/list_up_disabled.svg); }}"
-        down_style = f"QPushButton {{ background: transparent; border: none; border-image: url({assets_dir}/list_down.svg); }} QPushButton:hover {{ border-image: url({assets_dir}/list_down_hover.svg); }} QPushButton:pressed {{ border-image: url({assets_dir}/list_down.svg); }} QPushButton:disabled {{ border-image: url({assets_dir}/list_down_disabled.svg); }}"
-        delete_style = f"QPushButton {{ background: transparent; border: none; border-image: url({assets_dir}/list_delete.svg); }} QPushButton:hover {{ border-image: url({assets_dir}/list_delete_hover.svg); }} QPushButton:pressed {{ border-image: url({assets_dir}/list_delete.svg); }}"
-        
-        self.btn_up = QPushButton("")
-        self.btn_up.setFixedSize(20, 20)
-        self.btn_up.setStyleSheet(up_style)
-        self.btn_up.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.btn_up.clicked.connect(self.move_up)
-        
-        self.btn_down = QPushButton("")
-        self.btn_down.setFixedSize(20, 20)
-        self.btn_down.setStyleSheet(down_style)
-        self.btn_down.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.btn_down.clicked.connect(self.move_down)
-        
-        self.btn_delete = QPushButton("")
-        self.btn_delete.setFixedSize(20, 20)
-        self.btn_delete.setStyleSheet(delete_style)
-        self.btn_delete.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.btn_delete.clicked.connect(self.delete_item)
-        
-        layout.addWidget(self.btn_up)
-        layout.addWidget(self.btn_down)
-        layout.addWidget(self.btn_delete)
-        
-        self.setLayout(layout)
-        
-    def move_up(self):
-        self.main_window.move_queue_item_up(self.item)
-        
-    def move_down(self):
-        self.main_window.move_queue_item_down(self.item)
-        
-    def delete_item(self):
-        self.main_window.delete_queue_item_by_obj(self.item)
-        
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            current_time = time.time() * 1000
-            interval = QApplication.doubleClickInterval()
-            if current_time - self._last_click_time < interval:
-                self._last_click_time = 0
-                self.main_window.play_multi_merge_item(self.item)
+class ListRowDelegate(QStyledItemDelegate):
+    """
+    Paints a list row as elided text plus a strip of icon buttons on the right.
+    Replaces per-row item widgets: nothing is instantiated per row, so the view
+    stays virtualized no matter how many rows the model holds.
+    """
+    buttonClicked = Signal(str, int) # button name, row
+    DisabledButtonsRole = Qt.ItemDataRole.UserRole + 1 # Model returns the names of disabled buttons
+    ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
+    ROW_HEIGHT = 32
+    BUTTON_SIZE = 20
+    BUTTON_SPACING = 6
+    MARGIN = 5
+    _icon_cache = {}
+
+    def __init__(self, buttons, parent=None):
+        super().__init__(parent)
+        self.buttons = list(buttons) # Asset base names, e.g. "list_delete"
+        self._pressed = None # (button name, row) between press and release
+        self._view = None
+
+    @classmethod
+    def icon(cls, name):
+        if name not in cls._icon_cache:
+            cls._icon_cache[name] = QIcon(os.path.join(cls.ASSETS_DIR, f"{name}.svg"))
+        return cls._icon_cache[name]
+
+    def attach(self, view):
+        """Installs the delegate on a view and tracks the mouse for button hover states."""
+        self._view = view
+        view.setItemDelegate(self)
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        # Hover highlight follows the cursor within a row, which the view alone does not repaint
+        if self._view is not None and obj is self._view.viewport() and event.type() in (QEvent.Type.MouseMove, QEvent.Type.Leave):
+            obj.update()
+        return False
+
+    def button_rects(self, rect):
+        rects = []
+        x = rect.right() - self.MARGIN - self.BUTTON_SIZE + 1
+        y = rect.top() + (rect.height() - self.BUTTON_SIZE) // 2
+        for _ in self.buttons:
+            rects.insert(0, QRect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE))
+            x -= self.BUTTON_SIZE + self.BUTTON_SPACING
+        return rects
+
+    def sizeHint(self, option, index):
+        return QSize(0, self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        text = opt.text
+        opt.text = ""
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        # Background, hover and selection come from the stylesheet
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        rects = self.button_rects(option.rect)
+        text_rect = option.rect.adjusted(self.MARGIN, 0, -(self.MARGIN + len(rects) * (self.BUTTON_SIZE + self.BUTTON_SPACING)), 0)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+
+        painter.save()
+        painter.setPen(QColor("#ffffff") if selected else option.palette.color(QPalette.ColorRole.Text))
+        elided = option.fontMetrics.elidedText(text, Qt.TextElideMode.ElideMiddle, max(0, text_rect.width()))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, elided)
+
+        hover_pos = None
+        if self._view is not None and option.state & QStyle.StateFlag.State_MouseOver:
+            hover_pos = self._view.viewport().mapFromGlobal(QCursor.pos())
+        disabled = index.data(self.DisabledButtonsRole) or ()
+        for name, rect in zip(self.buttons, rects):
+            if name in disabled:
+                icon_name = f"{name}_disabled"
+            elif hover_pos is not None and rect.contains(hover_pos) and self._pressed is None:
+                icon_name = f"{name}_hover"
             else:
-                self._last_click_time = current_time
-                event.ignore()
-            return
-        super().mousePressEvent(event)
+                icon_name = name
+            self.icon(icon_name).paint(painter, rect)
+        painter.restore()
+
+    def _button_at(self, option, index, pos):
+        disabled = index.data(self.DisabledButtonsRole) or ()
+        for name, rect in zip(self.buttons, self.button_rects(option.rect)):
+            if rect.contains(pos) and name not in disabled:
+                return name
+        return None
+
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease, QEvent.Type.MouseButtonDblClick):
+            return False
+        if event.button() != Qt.MouseButton.LeftButton:
+            return False
+        name = self._button_at(option, index, event.position().toPoint())
+
+        if event_type == QEvent.Type.MouseButtonPress:
+            self._pressed = (name, index.row()) if name else None
+            return name is not None
+        if event_type == QEvent.Type.MouseButtonRelease:
+            pressed, self._pressed = self._pressed, None
+            if pressed and pressed == (name, index.row()):
+                self.buttonClicked.emit(name, index.row())
+                return True
+            return pressed is not None
+        # Double clicks on a button must not trigger the row action
+        return name is not None
+
+class SegmentListModel(QAbstractListModel):
+    """
+    Segment list shown under the player: the pending (active) selection first,
+    then the saved segments of a SegmentModel in time order.
+    Marks and deletes are single row inserts/removals instead of a full rebuild.
+    """
+    StartRole = Qt.ItemDataRole.UserRole
+    IsActiveRole = Qt.ItemDataRole.UserRole + 2
 
-    def mouseDoubleClickEvent(self, event):
-        event.ignore()
+    def __init__(self, segments, format_time, parent=None):
+        super().__init__(parent)
+        self.segments = segments
+        self.format_time = format_time
+        self.active = None # (start, end) being marked, shown as the first row
 
-class SegmentItemWidget(QWidget):
-    def __init__(self, text, item, main_window):
-        super().__init__()
-        self.item = item
-        self.main_window = main_window
-        self._last_click_time = 0
-        
-        layout = QHBoxLayout()
-        layout.setContentsMargins(5, 3, 5, 3)
-        
-        self.label = ElidedLabel(text)
-        self.label.setStyleSheet("background: transparent;")
-        
-        from PySide6.QtWidgets import QSizePolicy
-        self.label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        
-        layout.addWidget(self.label, 1) # Stretch factor 1
-        
-        import os
-        assets_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets").replace("\\", "/")
-        delete_style = f"QPushButton {{ background: transparent; border: none; border-image: url({assets_dir}/list_delete.svg); }} QPushButton:hover {{ border-image: url({assets_dir}/list_delete_hover.svg); }} QPushButton:pressed {{ border-image: url({assets_dir}/list_delete.svg); }}"
-        
-        self.btn_delete = QPushButton("")
-        self.btn_delete.setFixedSize(20, 20)
-        self.btn_delete.setStyleSheet(delete_style)
-        self.btn_delete.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.btn_delete.clicked.connect(self.delete_item)
-            
-        layout.addWidget(self.btn_delete)
-        self.setLayout(layout)
-        
-    def delete_item(self):
-        self.main_window.delete_segment_by_obj(self.item)
-        
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            current_time = time.time() * 1000
-            interval = QApplication.doubleClickInterval()
-            if current_time - self._last_click_time < interval:
-                self._last_click_time = 0
-                self.main_window.seek_to_segment(self.item)
-            else:
-                self._last_click_time = current_time
-                event.ignore()
-            return
-        super().mousePressEvent(event)
+    def _offset(self):
+        return 1 if self.active is not None else 0
 
-    def mouseDoubleClickEvent(self, event):
-        event.ignore()
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.segments) + self._offset()
+
+    def segment_position(self, row):
+        """Maps a row to an index in the SegmentModel, or -1 for the active row."""
+        return row - self._offset()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        position = self.segment_position(index.row())
+        if position < 0:
+            start, end = self.active
+            if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+                start_str = self.format_time(start) if start > 0 else "00:00:00"
+                end_str = self.format_time(end) if end > 0 else "미지정"
+                return f"> 현재 활성화: {start_str} ~ {end_str}"
+            if role == self.StartRole:
+                return int(start)
+            if role == self.IsActiveRole:
+                return True
+            return None
+
+        if position >= len(self.segments):
+            return None
+        start, end = self.segments[position]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return f"구간 {position+1}: {self.format_time(start)} ~ {self.format_time(end)}"
+        if role == self.StartRole:
+            return int(start)
+        if role == self.IsActiveRole:
+            return False
+        return None
+
+    def set_active(self, active):
+        """Shows, updates or hides (None) the active selection row."""
+        if active is None:
+            if self.active is not None:
+                self.beginRemoveRows(QModelIndex(), 0, 0)
+                self.active = None
+                self.endRemoveRows()
+        elif self.active is None:
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            self.active = active
+            self.endInsertRows()
+        elif self.active != active:
+            self.active = active
+            self.dataChanged.emit(self.index(0), self.index(0))
+
+    def add_segment(self, start, end):
+        """Inserts a segment. Returns its index in the SegmentModel."""
+        position = self.segments.insertion_index(start, end)
+        row = position + self._offset()
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.segments.add(start, end)
+        self.endInsertRows()
+        self._relabel(row + 1)
+        return position
+
+    def remove_segment(self, position):
+        row = position + self._offset()
+        self.beginRemoveRows(QModelIndex(), row, row)
+        segment = self.segments.remove_at(position)
+        self.endRemoveRows()
+        self._relabel(row)
+        return segment
+
+    def reset_segments(self, segments=None):
+        self.beginResetModel()
+        if segments is None:
+            self.segments.clear()
+        else:
+            self.segments.reset(segments)
+        self.endResetModel()
+
+    def _relabel(self, first_row):
+        # "구간 N" numbering shifts after an insert/remove; only visible rows actually repaint
+        last_row = self.rowCount() - 1
+        if first_row <= last_row:
+            self.dataChanged.emit(self.index(first_row), self.index(last_row),
+                                  [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole])
+
+class MergeQueueModel(QAbstractListModel):
+    """
+    Files queued for multi-file merge, in concat order.
+    Reordering goes through moveRows (used by both the up/down buttons and
+    drag & drop), so a move is one row move instead of a full list rebuild.
+    """
+    FileRole = Qt.ItemDataRole.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.files = []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.files)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.files):
+            return None
+        row = index.row()
+        file_path = self.files[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{row+1}. {os.path.basename(file_path)}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return file_path
+        if role == self.FileRole:
+            return file_path
+        if role == ListRowDelegate.DisabledButtonsRole:
+            # Disable Up on the first item, Down on the last item
+            disabled = set()
+            if row == 0:
+                disabled.add("list_up")
+            if row == len(self.files) - 1:
+                disabled.add("list_down")
+            return disabled
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled # Drops land between rows, never onto one
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def set_files(self, files):
+        self.beginResetModel()
+        self.files = list(files)
+        self.endResetModel()
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        if source_parent.isValid() or destination_parent.isValid():
+            return False
+        if count <= 0 or source_row < 0 or source_row + count > len(self.files):
+            return False
+        if source_row <= destination_child <= source_row + count:
+            return False # Moving onto itself
+        if not self.beginMoveRows(QModelIndex(), source_row, source_row + count - 1, QModelIndex(), destination_child):
+            return False
+        moved = self.files[source_row:source_row + count]
+        del self.files[source_row:source_row + count]
+        insert_at = destination_child - count if destination_child > source_row else destination_child
+        self.files[insert_at:insert_at] = moved
+        self.endMoveRows()
+        # Numbering and up/down states change only for the rows between the two positions
+        self._relabel(min(source_row, insert_at), max(source_row, insert_at) + count - 1)
+        return True
+
+    def move_file(self, row, offset):
+        """Moves a single row up (-1) or down (+1). Returns True if moved."""
+        target = row + offset
+        if not (0 <= row < len(self.files)) or not (0 <= target < len(self.files)):
+            return False
+        destination = target + 1 if offset > 0 else target
+        return self.moveRows(QModelIndex(), row, 1, QModelIndex(), destination)
+
+    def remove_file(self, row):
+        if not (0 <= row < len(self.files)):
+            return None
+        self.beginRemoveRows(QModelIndex(), row, row)
+        file_path = self.files.pop(row)
+        self.endRemoveRows()
+        self._relabel(max(0, row - 1), len(self.files) - 1)
+        return file_path
+
+    def _relabel(self, first_row, last_row):
+        if 0 <= first_row <= last_row < len(self.files):
+            self.dataChanged.emit(self.index(first_row), self.index(last_row))
 
 class ClickableVideoWidget(QWidget):
     """
@@ -342,11 +830,23 @@ class SeekSlider(QSlider):
     hover_time_changed = Signal(int, QPoint) # emits (time_msec, global_pos)
     hover_left = Signal()
 
+    _glyph_cache = {} # (svg_path, color, device_pixel_ratio) -> QPixmap
+
+    MIN_ZOOM_SPAN_MS = 2000
+
+    START_MARKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "start_check_point.svg")
+    END_MARKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "end_check_point.svg")
+
     def __init__(self, orientation, parent=None):
         super().__init__(orientation, parent)
-        self.segments = [] # List of tuples (start, end)
+        self.segments = SegmentModel()
         self.current_start = -1
         self.current_end = -1
+        self.keyframes = [] # Keyframe timestamps (ms) drawn as ticks
+        self.duration = 0 # Full timeline length; the slider range is the visible (zoomed) window
+        self._hover_x = -1
+        self._static_layer = None
+        self._static_layer_key = None
         self.setMouseTracking(True) # Ensure we get mouseMoveEvent without pressing buttons
 
     def set_current_selection(self, start, end):
@@ -356,7 +856,63 @@ class SeekSlider(QSlider):
 
     def set_segments(self, segments):
         self.segments = segments
-        self.update()
+        self.invalidate_static_layer()
+
+    def set_keyframes(self, keyframes):
+        self.keyframes = keyframes
+        self.invalidate_static_layer()
+
+    @classmethod
+    def glyph(cls, path, color, dpr):
+        """
+        Returns the SVG at path rendered and recolored as a QPixmap for the given
+        device pixel ratio. Rendered once per (asset, color, dpr) and reused by every repaint.
+        """
+        key = (path, color, dpr)
+        pm = cls._glyph_cache.get(key)
+        if pm is None:
+            pm = cls._render_glyph(path, color, dpr)
+            cls._glyph_cache[key] = pm
+        return pm
+
+    @staticmethod
+    def _render_glyph(path, color, dpr):
+        from PySide6.QtSvg import QSvgRenderer
+        from PySide6.QtCore import QRectF
+
+        renderer = QSvgRenderer(path)
+        if not renderer.isValid():
+            return QPixmap()
+        sz = renderer.defaultSize()
+        
+        # Render at device resolution so markers stay sharp on HiDPI screens
+        img = QImage(max(1, round(sz.width() * dpr)), max(1, round(sz.height() * dpr)), QImage.Format.Format_ARGB32_Premultiplied)
+        img.fill(Qt.GlobalColor.transparent)
+        
+        p2 = QPainter(img)
+        p2.setRenderHint(QPainter.RenderHint.Antialiasing)
+        renderer.render(p2, QRectF(0, 0, img.width(), img.height()))
+        
+        # Composition mode to recolor the whole glyph
+        p2.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        p2.fillRect(img.rect(), QColor(color))
+        p2.end()
+        
+        pm = QPixmap.fromImage(img)
+        pm.setDevicePixelRatio(dpr)
+        return pm
+
+    @classmethod
+    def invalidate_glyphs(cls):
+        cls._glyph_cache.clear()
+
+    def changeEvent(self, event):
+        # Theme or screen (DPI) changes invalidate the pre-rendered glyphs
+        dpr_change = getattr(QEvent.Type, "DevicePixelRatioChange", None)
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.PaletteChange) or (dpr_change is not None and event.type() == dpr_change):
+            self.invalidate_glyphs()
+            self.invalidate_static_layer()
+        super().changeEvent(event)
 
     def mouseMoveEvent(self, event):
         val = self.pixelPosToRangeValue(event.position().x())
@@ -368,9 +924,13 @@ class SeekSlider(QSlider):
             pos = event.globalPosition().toPoint()
             # Convert to just passing the raw value or fraction, letting main window do math
             self.hover_time_changed.emit(val, pos)
+            self._hover_x = int(event.position().x())
+            self.update()
         super().mouseMoveEvent(event)
 
     def leaveEvent(self, event):
+        self._hover_x = -1
+        self.update()
         self.hover_left.emit()
         super().leaveEvent(event)
 
@@ -382,11 +942,147 @@ class SeekSlider(QSlider):
             event.accept()
         super().mousePressEvent(event)
 
+    def _value_to_px(self, val, gr):
+        val_range = self.maximum() - self.minimum()
+        if val < 0 or val_range <= 0: return -1
+        ratio = (val - self.minimum()) / val_range
+        return gr.x() + int(ratio * gr.width())
+
+    def _draw_marker(self, painter, path, x_pos, bar_y, bar_height, align="start"):
+        dpr = self.devicePixelRatioF()
+        pm = self.glyph(path, "white", dpr)
+        if pm.isNull():
+            return
+        target_w = pm.width() / dpr
+        target_h = pm.height() / dpr
+        
+        # Align left edge to x_pos if start, align right edge to x_pos if end
+        target_x = x_pos if align == "start" else x_pos - target_w
+        target_y = bar_y - (target_h / 2.0) + (bar_height / 2.0)
+        painter.drawPixmap(QPointF(target_x, target_y), pm)
+
+    def _static_layer_pixmap(self, gr, bar_y, bar_height):
+        """
+        Returns the cached layer with keyframe ticks, saved segment bars and their markers.
+        It only changes when segments/keyframes are edited or the geometry, range or DPI
+        changes, so playback repaints just blit it.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, self.minimum(), self.maximum(), gr.x(), gr.y(), gr.width(), gr.height())
+        if self._static_layer is not None and self._static_layer_key == key:
+            return self._static_layer
+
+        layer = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+        layer.setDevicePixelRatio(dpr)
+        layer.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(layer)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Keyframe ticks under the groove, one per pixel column; skipped when too dense to read
+        if self.keyframes and gr.width() > 0:
+            columns = {self._value_to_px(k, gr) for k in self.keyframes if self.minimum() <= k <= self.maximum()}
+            if len(columns) * 3 <= gr.width():
+                painter.setPen(QPen(QColor("#8a8a8a"), 1))
+                tick_y = gr.bottom()
+                for x in columns:
+                    painter.drawLine(x, tick_y - 1, x, tick_y + 1)
+
+        # Level of detail: cull segments outside the visible range and merge those that
+        # touch at pixel resolution, so drawing scales with the widget width, not the segment count
+        lo, hi = self.minimum(), self.maximum()
+        spans = [] # [s_px, e_px, segment_count, start_visible, end_visible]
+        for index in self.segments.overlapping(lo - 1, hi + 1):
+            start, end = self.segments[index]
+            s_px = self._value_to_px(max(start, lo), gr)
+            e_px = max(s_px + 1, self._value_to_px(min(end, hi), gr))
+            if spans and s_px <= spans[-1][1] + 1:
+                last = spans[-1]
+                if e_px >= last[1]:
+                    last[1] = e_px
+                    last[4] = end <= hi
+                last[2] += 1
+            else:
+                spans.append([s_px, e_px, 1, start >= lo, end <= hi])
+
+        painter.setPen(QPen(QColor("#777777"), 1))
+        for s_px, e_px, count, _, _ in spans:
+            # Aggregated bars are slightly darker to show they stand for several segments
+            painter.setBrush(QColor("#ffd700") if count == 1 else QColor("#d4a800"))
+            painter.drawRoundedRect(s_px, bar_y, e_px - s_px, bar_height, 2, 2)
+
+        # Markers only where they can be told apart from their neighbours
+        start_glyph = self.glyph(self.START_MARKER, "white", dpr)
+        marker_w = start_glyph.width() / dpr if not start_glyph.isNull() else 0
+        for i, (s_px, e_px, count, start_visible, end_visible) in enumerate(spans):
+            gap_before = s_px - spans[i - 1][1] if i > 0 else marker_w
+            gap_after = spans[i + 1][0] - e_px if i + 1 < len(spans) else marker_w
+            if min(gap_before, gap_after) < marker_w and e_px - s_px < marker_w * 2:
+                continue
+            if start_visible:
+                self._draw_marker(painter, self.START_MARKER, s_px, bar_y, bar_height, align="start")
+            if end_visible:
+                self._draw_marker(painter, self.END_MARKER, e_px, bar_y, bar_height, align="end")
+
+        painter.end()
+        self._static_layer = layer
+        self._static_layer_key = key
+        return layer
+
+    def set_duration(self, duration):
+        """Sets the full timeline length (ms) and resets any zoom."""
+        self.duration = duration
+        self.setRange(0, duration)
+
+    def is_zoomed(self):
+        return self.duration > 0 and (self.maximum() - self.minimum()) < self.duration
+
+    def zoom(self, factor, anchor):
+        """Zooms the visible range by factor around the anchor value (ms)."""
+        if self.duration <= 0:
+            return
+        span = self.maximum() - self.minimum()
+        new_span = int(min(self.duration, max(self.MIN_ZOOM_SPAN_MS, span / factor)))
+        ratio = (anchor - self.minimum()) / span if span > 0 else 0.5
+        lo = int(anchor - ratio * new_span)
+        lo = max(0, min(lo, self.duration - new_span))
+        value = self.value()
+        self.setRange(lo, lo + new_span)
+        self.setValue(value)
+
+    def pan(self, delta):
+        span = self.maximum() - self.minimum()
+        lo = max(0, min(self.minimum() + delta, self.duration - span))
+        value = self.value()
+        self.setRange(lo, lo + span)
+        self.setValue(value)
+
+    def set_playhead(self, position):
+        # When zoomed, keep the playhead in view by paging the visible range
+        if self.is_zoomed() and not (self.minimum() <= position <= self.maximum()):
+            span = self.maximum() - self.minimum()
+            lo = max(0, min(position - span // 10, self.duration - span))
+            self.setRange(lo, lo + span)
+        self.setValue(position)
+
+    def wheelEvent(self, event):
+        # Ctrl+wheel zooms around the cursor, plain wheel pans while zoomed
+        steps = event.angleDelta().y() / 120.0
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            anchor = self.pixelPosToRangeValue(event.position().x())
+            self.zoom(1.25 ** steps, anchor)
+            event.accept()
+        elif self.is_zoomed():
+            self.pan(int(-steps * (self.maximum() - self.minimum()) / 10))
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    def invalidate_static_layer(self):
+        self._static_layer = None
+        self.update()
+
     def paintEvent(self, event):
-        from PySide6.QtSvg import QSvgRenderer
-        from PySide6.QtCore import QRectF, Qt
-        from PySide6.QtGui import QPainter, QImage, QColor, QPen, QRegion
-        import os
+        from PySide6.QtGui import QRegion
         
         # 1. First draw the default QSlider (Track and Handle)
         super().paintEvent(event)
@@ -410,81 +1106,29 @@ class SeekSlider(QSlider):
 
         # 2. Add Groove helper stats
         gr = self.style().subControlRect(QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderGroove, self)
-        slider_length = gr.width()
-        slider_min_pos = gr.x()
-        rect_height = gr.height()
-        rect_y = gr.y()
-
-        def get_px(val):
-            if val < 0: return -1
-            ratio = (val - self.minimum()) / val_range
-            return slider_min_pos + int(ratio * slider_length)
-
-        # 3. Draw our custom selection segments
         bar_height = 4
-        bar_y = rect_y + (rect_height - bar_height) // 2
-        
-        for start, end in self.segments:
-            s_px = get_px(start)
-            e_px = get_px(end)
-            if s_px >= 0 and e_px > s_px:
-                painter.setBrush(QColor("#ffd700"))
-                painter.setPen(QPen(QColor("#777777"), 1))
-                painter.drawRoundedRect(s_px, bar_y, e_px - s_px, bar_height, 2, 2)
+        bar_y = gr.y() + (gr.height() - bar_height) // 2
 
-        start_px = get_px(self.current_start)
-        end_px = get_px(self.current_end)
+        # 3. Static layer: segments, markers and keyframe ticks (cached)
+        painter.drawPixmap(0, 0, self._static_layer_pixmap(gr, bar_y, bar_height))
+
+        # 4. Dynamic layer: current selection and hover position
+        start_px = self._value_to_px(self.current_start, gr)
+        end_px = self._value_to_px(self.current_end, gr)
 
         if start_px >= 0 and end_px > start_px:
             painter.setBrush(QColor(0, 120, 215, 255))
             painter.setPen(QPen(QColor("#777777"), 1))
             painter.drawRoundedRect(start_px, bar_y, end_px - start_px, bar_height, 2, 2)
 
-        # 4. Draw SVGs (Recolored to White)
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        def draw_svg_icon(path, x_pos, align="start"):
-            renderer = QSvgRenderer(path)
-            if renderer.isValid():
-                sz = renderer.defaultSize()
-                target_w = sz.width()
-                target_h = sz.height()
-                
-                # Render to an image using original exact size
-                img = QImage(int(target_w), int(target_h), QImage.Format.Format_ARGB32_Premultiplied)
-                img.fill(Qt.GlobalColor.transparent)
-                
-                p2 = QPainter(img)
-                p2.setRenderHint(QPainter.RenderHint.Antialiasing)
-                renderer.render(p2, QRectF(0, 0, target_w, target_h))
-                
-                # Composition mode to make it fully white
-                p2.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
-                p2.fillRect(img.rect(), Qt.GlobalColor.white)
-                p2.end()
-                
-                # Align left edge to x_pos if start, align right edge to x_pos if end
-                target_x = x_pos if align == "start" else x_pos - target_w
-                target_y = bar_y - (target_h / 2.0) + (bar_height / 2.0)
-
-                target_rect = QRectF(target_x, target_y, target_w, target_h)
-                painter.drawImage(target_rect, img)
-
-        # Draw markers for saved segments
-        for start, end in self.segments:
-            s_px = get_px(start)
-            e_px = get_px(end)
-            if s_px >= 0:
-                draw_svg_icon(os.path.join(base_dir, "assets", "start_check_point.svg"), s_px, align="start")
-            if e_px >= 0:
-                draw_svg_icon(os.path.join(base_dir, "assets", "end_check_point.svg"), e_px, align="end")
-
-        # Draw markers for current selection
         if start_px >= 0:
-            draw_svg_icon(os.path.join(base_dir, "assets", "start_check_point.svg"), start_px, align="start")
-
+            self._draw_marker(painter, self.START_MARKER, start_px, bar_y, bar_height, align="start")
         if end_px >= 0:
-            draw_svg_icon(os.path.join(base_dir, "assets", "end_check_point.svg"), end_px, align="end")
+            self._draw_marker(painter, self.END_MARKER, end_px, bar_y, bar_height, align="end")
+
+        if self._hover_x >= gr.x():
+            painter.setPen(QPen(QColor(255, 255, 255, 120), 1))
+            painter.drawLine(self._hover_x, gr.y(), self._hover_x, gr.bottom())
 
         painter.end()
 
@@ -511,100 +1155,38 @@ class SeekSlider(QSlider):
 class ExportWorker(QThread):
     progress = Signal(int)
     log = Signal(str)
+    stats = Signal(dict) # bytes, throughput, speed, eta from the ffmpeg -progress stream
     finished = Signal(bool, list, str)
 
-    def __init__(self, tasks, parent=None):
+    def __init__(self, tasks, parent=None, max_workers=None, journal=None):
         super().__init__(parent)
         self.tasks = tasks
-        self.running = True
-        self.process = None
+        self.journal = journal
+        # Independent cut tasks run concurrently, the concat task waits on its 'depends_on'.
+        # Finished tasks are journaled so an interrupted export can resume.
+        self.runner = task_runner.TaskRunner(
+            tasks, max_workers,
+            on_progress=self.progress.emit,
+            on_log=self.log.emit,
+            journal=journal,
+            on_stats=self.stats.emit
+        )
 
-    def run(self):
-        total_duration_ms = sum(t.get('duration_ms', 0) for t in self.tasks)
-        completed_ms = 0
-        success_count = 0
-        generated_files = []
-        fail_messages = []
-        
-        for task in self.tasks:
-            if not self.running:
-                break
-                
-            cmd = task['cmd']
-            desc = task.get('desc', '작업 중...')
-            self.log.emit(desc)
-            task_duration = task.get('duration_ms', 0)
-            
-            try:
-                self.process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True,
-                    encoding='utf-8',
-                    errors='replace',
-                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-                )
-            except Exception as e:
-                fail_messages.append(f"{desc} 실행 실패: {e}")
-                continue
+    @property
+    def failed_outputs(self):
+        """Partial outputs of the tasks that failed or were interrupted."""
+        return self.runner.failed_outputs
 
-            time_pattern = re.compile(r"time=(\d+):(\d+):(\d+\.\d+)")
-            
-            while True:
-                if not self.running:
-                    try:
-                        self.process.kill()
-                    except:
-                        pass
-                    break
-                    
-                try:
-                    line = self.process.stderr.readline()
-                except Exception as e:
-                    fail_messages.append(f"{desc} 로그 읽기 오류: {e}")
-                    break
-                    
-                if not line and self.process.poll() is not None:
-                    break
-                    
-                match = time_pattern.search(line)
-                if match and total_duration_ms > 0:
-                    h, m, s = match.groups()
-                    current_ms = int(h) * 3600000 + int(m) * 60000 + float(s) * 1000
-                    overall_progress_ms = completed_ms + current_ms
-                    percent = int((overall_progress_ms / total_duration_ms) * 100)
-                    self.progress.emit(min(99, percent))
-            
-            self.process.wait()
-            if 'cleanup_file' in task and os.path.exists(task['cleanup_file']):
-                try: os.remove(task['cleanup_file'])
-                except: pass
-                
-            if self.process.returncode == 0 and self.running:
-                success_count += 1
-                if 'output' in task:
-                    generated_files.append(task['output'])
-            elif self.running:
-                fail_messages.append(f"{desc} 에러 발생")
-            
-            completed_ms += task_duration
-        
-        if not self.running:
-            self.finished.emit(False, generated_files, "사용자에 의해 취소됨")
-        elif fail_messages:
-            self.finished.emit(False, generated_files, "\n".join(fail_messages))
-        else:
-            self.progress.emit(100)
-            self.finished.emit(True, generated_files, "모든 작업 완료")
+    @property
+    def running(self):
+        return self.runner.running
+
+    def run(self):
+        success, generated_files, msg = self.runner.run()
+        self.finished.emit(success, generated_files, msg)
 
     def cancel(self):
-        self.running = False
-        if self.process:
-            try:
-                self.process.kill()
-            except:
-                pass
+        self.runner.cancel()
 
 
 class MainWindow(QMainWindow):
@@ -730,17 +1312,17 @@ class MainWindow(QMainWindow):
                 padding-left: 4px;
                 padding-right: 4px;
             }
-            QListWidget {
+            QListView {
                 border: 1px solid #777777;
                 background-color: #2b2b2b;
             }
-            QListWidget::item {
+            QListView::item {
                 border-bottom: 1px solid #444444;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #3d3d3d;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #4f3b15;
                 color: #ffffff;
                 border-left: 4px solid #ffcc00;
@@ -791,11 +1373,11 @@ class MainWindow(QMainWindow):
         )
         self.player.volume = 100
 
-        # Timer for polling MPV state (replaces Qt signal-based updates)
-        self._mpv_timer = QTimer(self)
-        self._mpv_timer.setInterval(50)
-        self._mpv_timer.timeout.connect(self._mpv_poll)
-        self._mpv_timer.start()
+        # MPV property observers (event-driven, coalesced onto the Qt thread)
+        self._mpv_position_ms = 0
+        self._mpv_duration_ms = 0
+        self._mpv_bridge = MpvPropertyBridge(self.player, ["time-pos", "duration", "pause"], self)
+        self._mpv_bridge.changed.connect(self._on_mpv_properties)
 
         # Top Panel Container (for fullscreen hover display)
         self.top_panel = QWidget(self.central_widget)
@@ -951,7 +1533,7 @@ class MainWindow(QMainWindow):
         # Cut Controls
         self.start_time = 0
         self.end_time = 0
-        self.segments = [] # List of (start, end)
+        self.segments = SegmentModel() # Sorted (start, end) intervals
         
         self.start_icon = QIcon("assets/start_point.svg")
         self.set_start_btn = QPushButton()
@@ -1028,6 +1610,20 @@ class MainWindow(QMainWindow):
         self.merge_checkbox.setEnabled(False)
         self.controls_layout.addWidget(self.merge_checkbox)
 
+        # Merges cut and join in one pass by default; per-part merges cost disk space but resume part by part
+        self.resumable_checkbox = QCheckBox("구간별 이어하기")
+        self.resumable_checkbox.setStyleSheet("color: #cccccc;")
+        self.resumable_checkbox.setToolTip("병합할 구간을 임시 파일로 하나씩 내보낸 뒤 합칩니다.\n디스크 공간이 두 배로 필요하지만, 중단되면 완료된 구간부터 이어서 진행합니다.")
+        self.resumable_checkbox.setEnabled(False)
+        self.merge_checkbox.toggled.connect(self.resumable_checkbox.setEnabled)
+        self.controls_layout.addWidget(self.resumable_checkbox)
+
+        self.smart_cut_checkbox = QCheckBox("정밀 자르기 (Smart Cut)")
+        self.smart_cut_checkbox.setStyleSheet("color: #cccccc;")
+        self.smart_cut_checkbox.setToolTip("구간 경계의 GOP 조각만 재인코딩하고 나머지는 그대로 복사하여 프레임 단위로 정확하게 자릅니다.")
+        self.smart_cut_checkbox.setEnabled(False)
+        self.controls_layout.addWidget(self.smart_cut_checkbox)
+
         self.export_btn = QPushButton("내보내기")
         self.export_btn.clicked.connect(self.export_video)
         self.export_btn.setEnabled(False)
@@ -1173,9 +1769,15 @@ class MainWindow(QMainWindow):
         self.segments_label.setStyleSheet("color: gold; font-weight: bold; margin-top: 4px; margin-bottom: 4px;")
         self.segments_layout.addWidget(self.segments_label)
         
-        self.segments_list = QListWidget()
+        self.segments_list_model = SegmentListModel(self.segments, self.format_time, self)
+        self.segments_list = QListView()
+        self.segments_list.setModel(self.segments_list_model)
         self.segments_list.setFixedHeight(75)
-        self.segments_list.itemDoubleClicked.connect(self.seek_to_segment)
+        self.segments_list.setUniformItemSizes(True)
+        self.segments_list.doubleClicked.connect(self.seek_to_segment)
+        self.segments_delegate = ListRowDelegate(["list_delete"], self.segments_list)
+        self.segments_delegate.attach(self.segments_list)
+        self.segments_delegate.buttonClicked.connect(lambda name, row: self.delete_segment_row(row))
         
         self.delete_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Delete), self.segments_list)
         self.delete_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
@@ -1190,11 +1792,19 @@ class MainWindow(QMainWindow):
         self.merge_queue_label.setStyleSheet("color: gold; font-weight: bold; margin-top: 4px; margin-bottom: 4px;")
         self.merge_queue_layout.addWidget(self.merge_queue_label)
         
-        self.merge_queue_list = QListWidget()
+        self.merge_queue_model = MergeQueueModel(self)
+        self.merge_queue_model.rowsMoved.connect(self._sync_merge_play_index)
+        self.merge_queue_model.rowsRemoved.connect(self._sync_merge_play_index)
+        self.merge_queue_list = QListView()
+        self.merge_queue_list.setModel(self.merge_queue_model)
         self.merge_queue_list.setFixedHeight(75)
-        self.merge_queue_list.itemDoubleClicked.connect(self.play_multi_merge_item)
+        self.merge_queue_list.setUniformItemSizes(True)
+        self.merge_queue_list.doubleClicked.connect(self.play_multi_merge_item)
         self.merge_queue_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
-        self.merge_queue_list.model().rowsMoved.connect(self.sync_merge_queue)
+        self.merge_queue_list.setDefaultDropAction(Qt.DropAction.MoveAction)
+        self.merge_queue_delegate = ListRowDelegate(["list_up", "list_down", "list_delete"], self.merge_queue_list)
+        self.merge_queue_delegate.attach(self.merge_queue_list)
+        self.merge_queue_delegate.buttonClicked.connect(self.on_merge_queue_button)
         
         self.merge_delete_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Delete), self.merge_queue_list)
         self.merge_delete_shortcut.setContext(Qt.ShortcutContext.WidgetShortcut)
@@ -1225,8 +1835,8 @@ class MainWindow(QMainWindow):
         self.is_slider_pressed = False
         self._was_playing_before_slider = False
         self.is_multi_merge_mode = False
-        self.multi_merge_files = []
         self.multi_merge_play_idx = -1
+        self._merge_play_index = QPersistentModelIndex() # Follows the playing file through reorders
         
         # Setup Hover Filter Class with QPixmap Colorization
         class IconColorizeHoverFilter(QObject):
@@ -1269,26 +1879,125 @@ class MainWindow(QMainWindow):
         self.setAcceptDrops(True)
         self._is_centered = False
         
-        # Thumbnail Tooltip and Thread 
-        self.thumbnail_thread = ThumbnailGrabberThread(self)
-        self.thumbnail_thread.thumbnail_ready.connect(self.on_thumbnail_ready)
-        self.thumbnail_thread.start()
-        
-        self.thumbnail_tooltip = ThumbnailTooltip(self)
+        # Keyframe index (built once per file, reused by the cutter)
+        self.keyframes = []
+        self.keyframe_thread = KeyframeIndexThread(self)
+        self.keyframe_thread.index_ready.connect(self.on_keyframe_index_ready)
+
+        # Stream/format probing off the GUI thread; the track table fills in when it arrives
+        self.probe_service = ProbeService(parent=self)
+        self.probe_service.probe_ready.connect(self.on_probe_ready)
+        self.probe_service.batch_progress.connect(self.on_batch_probe_progress)
+        self.probe_service.batch_ready.connect(self.on_batch_probe_ready)
+        self.merge_probes = {} # file_path -> probe of the queued merge files
+        self.merge_probe_pending = set() # Queued files a running batch is still probing
+        self.merge_export_pending = False # Export asked for before the queue was analysed
+
+        # Whole-timeline sprite sheet for instant hover previews
+        self.sprite_sheet = None # (video_path, meta, QImage)
+        self._hover_time_msec = -1
+        self.sprite_thread = SpriteSheetThread(self)
+        self.sprite_thread.sprite_ready.connect(self.on_sprite_ready)
+
+        # Fast keyframe previews while the mouse moves, exact frame once it rests
+        self._hover_rest_timer = QTimer(self)
+        self._hover_rest_timer.setSingleShot(True)
+        self._hover_rest_timer.setInterval(200)
+        self._hover_rest_timer.timeout.connect(self.on_slider_hover_rest)
+
+    def on_sprite_ready(self, video_path, meta, data):
+        if video_path != self.file_path:
+            return
+        qimg = QImage()
+        if qimg.loadFromData(data) and not qimg.isNull():
+            self.sprite_sheet = (video_path, meta, qimg)
+
+    def sprite_tile(self, time_msec):
+        """Returns the sprite sheet tile nearest to time_msec as a QPixmap, or None."""
+        if not self.sprite_sheet or self.sprite_sheet[0] != self.file_path:
+            return None
+        _, meta, qimg = self.sprite_sheet
+        idx = min(meta['count'] - 1, max(0, int(round(time_msec / meta['interval_ms']))))
+        tile_w = qimg.width() // meta['columns']
+        tile_h = qimg.height() // meta['rows']
+        if tile_w <= 0 or tile_h <= 0:
+            return None
+        col = idx % meta['columns']
+        row = idx // meta['columns']
+        tile = qimg.copy(col * tile_w, row * tile_h, tile_w, tile_h)
+        return QPixmap.fromImage(tile).scaled(288, 162, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+
+    def on_probe_ready(self, file_path, probe):
+        if file_path != self.file_path or getattr(self, 'is_multi_merge_mode', False):
+            return
+        self.load_tracks_to_table(file_path, video_cutter.tracks_from_probe(probe))
+        self.tracks_loaded = True
+        self.update_header_checkbox_state()
+        self.check_export_ready()
 
-        self.slider.hover_time_changed.connect(self.on_slider_hovered)
-        self.slider.hover_left.connect(self.on_slider_leave)
+    def on_batch_probe_progress(self, done, total):
+        if self.is_multi_merge_mode:
+            self.statusBar().showMessage(f"병합 대기열 파일 정보 분석 중... ({done}/{total})")
+
+    def on_batch_probe_ready(self, file_paths, probes):
+        if not self.is_multi_merge_mode:
+            return
+        self.merge_probes.update(zip(file_paths, probes))
+        self.merge_probe_pending.difference_update(file_paths)
+        report = self.merge_compatibility_report()
+        if report is None:
+            return # Another batch is still running for the rest of the queue
+        flagged = [f for f in report['files'] if f['verdict'] != video_cutter.CONCAT_COPY]
+        if report['verdict'] == video_cutter.CONCAT_REENCODE:
+            self.statusBar().showMessage(f"경고: {len(flagged)}개 파일이 첫 번째 파일과 코덱 설정이 달라 무손실 병합이 불가능합니다.")
+        elif report['verdict'] == video_cutter.CONCAT_REMUX:
+            self.statusBar().showMessage(f"주의: {len(flagged)}개 파일의 타임베이스/코덱 헤더/컨테이너가 달라 재먹싱이 필요할 수 있습니다.")
+        else:
+            self.statusBar().showMessage(f"병합 대기열 {len(self.multi_merge_files)}개 파일 모두 무손실 병합 가능합니다.")
+        if self.merge_export_pending:
+            self.merge_export_pending = False
+            self.export_video()
+
+    def request_merge_probes(self):
+        """
+        Starts a background batch for queued files that have no probe yet, unless a
+        running batch already covers them. Returns True if every file is probed.
+        """
+        missing = [f for f in self.multi_merge_files if f not in self.merge_probes]
+        if missing and not set(missing) <= self.merge_probe_pending:
+            self.merge_probe_pending = set(missing)
+            self.probe_service.request_batch(missing)
+        return not missing
+
+    def merge_compatibility_report(self):
+        """
+        Runs the concat precheck on the queue in its current order.
+        Returns None while files are still being probed (the batch is started if needed);
+        on_batch_probe_ready reports once they are in.
+        """
+        if not self.request_merge_probes():
+            return None
+        probes = [self.merge_probes.get(f) for f in self.multi_merge_files]
+        return video_cutter.check_concat_compatibility(self.multi_merge_files, probes)
+
+    def on_keyframe_index_ready(self, video_path, keyframes):
+        if video_path != self.file_path:
+            return
+        self.keyframes = keyframes
+        self.thumbnail_thread.set_keyframes(video_path, keyframes)
+        self.slider.set_keyframes(keyframes)
+        if keyframes:
+            self.statusBar().showMessage(f"키프레임 인덱스 준비 완료: {len(keyframes)}개")
 
     def on_slider_hovered(self, val, global_pos):
-        if not hasattr(self, 'file_path') or not self.file_path or self._mpv_dur_ms() <= 0:
+        if not hasattr(self, 'file_path') or not self.file_path or self._mpv_duration_ms <= 0:
             return
             
-        duration = self._mpv_dur_ms()
         val_range = self.slider.maximum() - self.slider.minimum()
         if val_range <= 0: return
         
-        fraction = val / val_range
-        time_msec = int(duration * fraction)
+        # The slider range is in ms (and may be a zoomed window), so the value is the time
+        time_msec = min(int(val), self._mpv_duration_ms)
         
         time_str = QTime(0, 0, 0).addMSecs(max(0, time_msec)).toString("hh:mm:ss")
         
@@ -1305,11 +2014,24 @@ class MainWindow(QMainWindow):
             self.thumbnail_tooltip.show()
             
         if self.file_path:
-            self.thumbnail_thread.request_thumbnail(self.file_path, time_msec)
+            self._hover_time_msec = time_msec
+            # Show the nearest sprite tile right away; the exact frame replaces it when ready
+            tile = self.sprite_tile(time_msec)
+            if tile is not None:
+                self.thumbnail_tooltip.img_label.setPixmap(tile)
+            self.thumbnail_thread.request_thumbnail(self.file_path, time_msec, exact=False)
+            self._hover_rest_timer.start()
+
+    def on_slider_hover_rest(self):
+        if self.file_path and self._hover_time_msec >= 0 and self.thumbnail_tooltip.isVisible():
+            self.thumbnail_thread.request_thumbnail(self.file_path, self._hover_time_msec, exact=True)
 
     def on_thumbnail_ready(self, time_msec, img_data):
         if not hasattr(self, 'thumbnail_tooltip') or not self.thumbnail_tooltip.isVisible():
             return
+        # With a sprite tile on screen, a frame for an old hover position would be a step back
+        if self.sprite_sheet and abs(time_msec - self._hover_time_msec) > 1000:
+            return
             
         qimg = QImage()
         loaded = qimg.loadFromData(img_data)
@@ -1319,6 +2041,8 @@ class MainWindow(QMainWindow):
             self.thumbnail_tooltip.img_label.setPixmap(pixmap)
 
     def on_slider_leave(self):
+        if hasattr(self, '_hover_rest_timer'):
+            self._hover_rest_timer.stop()
         if hasattr(self, 'thumbnail_tooltip'):
             self.thumbnail_tooltip.hide()
 
@@ -1568,9 +2292,10 @@ class MainWindow(QMainWindow):
     def load_multi_files(self, files):
         self.stop_and_clear()
         self.is_multi_merge_mode = True
-        self.multi_merge_files = list(files)
-        
-        self._refresh_merge_queue_ui()
+        self.merge_queue_model.set_files(files)
+        self.merge_probes = {}
+        self.merge_probe_pending = set()
+        self.request_merge_probes()
             
         self.setWindowTitle("MKV Lossless Cutter - 다중 파일 병합 모드")
         self.export_btn.setEnabled(True)
@@ -1599,6 +2324,7 @@ class MainWindow(QMainWindow):
     def _play_queue_index(self, index):
         if 0 <= index < len(self.multi_merge_files):
             self.multi_merge_play_idx = index
+            self._merge_play_index = QPersistentModelIndex(self.merge_queue_model.index(index))
             file_path = self.multi_merge_files[index]
             self.file_path = file_path
             
@@ -1606,18 +2332,22 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'thumbnail_tooltip') and self.thumbnail_tooltip:
                 self.thumbnail_tooltip.img_label.clear()
                 
+            self.sprite_sheet = None
+            self.sprite_thread.request_sprite(file_path)
+                
             self.player.play(file_path)
             self.play_video()
-            self.merge_queue_list.setCurrentRow(index)
+            self.merge_queue_list.setCurrentIndex(self.merge_queue_model.index(index))
             self.top_title_label.setText(os.path.basename(file_path))
             self.setWindowTitle(f"MKV Lossless Cutter - 다중 파일 미리보기 ({index+1}/{len(self.multi_merge_files)})")
 
-    def play_multi_merge_item(self, item):
+    def play_multi_merge_item(self, index):
         if not self.is_multi_merge_mode: return
-        row = self.merge_queue_list.row(item)
-        self._play_queue_index(row)
+        self._play_queue_index(index.row())
 
     def load_file(self, file_path):
+        if self.file_path and hasattr(self, 'thumbnail_thread'):
+            self.thumbnail_thread.log_stats(self.file_path)
         self.file_path = file_path
         
         # Clear previous thumbnail
@@ -1645,21 +2375,36 @@ class MainWindow(QMainWindow):
         # Reset selection
         self.start_time = 0
         self.end_time = 0
-        self.segments = []
+        self.segments_list_model.reset_segments()
         self.slider.set_segments(self.segments)
         self.slider.set_current_selection(-1, -1)
         self.update_segments_list()
         
-        # Load tracks into table
-        self.load_tracks_to_table(self.file_path)
+        # Load tracks into table (asynchronously, the player does not wait for ffprobe)
+        self.tracks_table.setRowCount(0)
+        self.tracks_loaded = False # Export waits for the probe; an empty table would drop tracks
+        self.probe_service.request_probe(self.file_path)
+
+        # Build (or load cached) keyframe index and sprite sheet in the background
+        self.keyframes = []
+        self.slider.set_keyframes([])
+        self.keyframe_thread.request_index(self.file_path)
+        self.sprite_sheet = None
+        self.sprite_thread.request_sprite(self.file_path)
         
         self.check_export_ready()
         self.statusBar().showMessage(f"파일 불러옴: {os.path.basename(self.file_path)}")
 
     def stop_and_clear(self):
+        if self.file_path and hasattr(self, 'thumbnail_thread'):
+            self.thumbnail_thread.log_stats(self.file_path)
         self.is_multi_merge_mode = False
-        self.multi_merge_files = []
-        self._refresh_merge_queue_ui()
+        self.merge_queue_model.set_files([])
+        self.merge_probes = {}
+        self.merge_probe_pending = set()
+        self.merge_export_pending = False
+        if hasattr(self, 'probe_service'):
+            self.probe_service.cancel_batch()
         self.file_path = None
         self.player.command('stop')
         
@@ -1678,7 +2423,7 @@ class MainWindow(QMainWindow):
         self.clear_btn.setEnabled(False)
         self.segments_label.setText("선택된 자르기 구간 목록")
         self.multi_merge_play_idx = -1
-        self.merge_queue_list.clear()
+        self._merge_play_index = QPersistentModelIndex()
         self.export_btn.setText("내보내기")
         self.slider.setEnabled(True)
 
@@ -1701,18 +2446,31 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("MKV Lossless Cutter")
         
         # UI 및 타임라인 초기화
-        self.slider.setRange(0, 0)
+        self.slider.set_duration(0)
         self.slider.setValue(0)
+        self._mpv_position_ms = 0
+        self._mpv_duration_ms = 0
         self.time_label.setText("00:00:00 / 00:00:00")
         
         # 선택 구간 초기화
         self.start_time = 0
         self.end_time = 0
-        self.segments = []
+        self.segments_list_model.reset_segments()
         self.slider.set_segments(self.segments)
         self.slider.set_current_selection(-1, -1)
         self.update_segments_list()
         self.tracks_table.setRowCount(0)
+        if hasattr(self, 'probe_service'):
+            self.probe_service.cancel()
+        self.keyframes = []
+        self.slider.set_keyframes([])
+        if hasattr(self, 'keyframe_thread'):
+            self.keyframe_thread.cancel()
+        self.sprite_sheet = None
+        if hasattr(self, 'sprite_thread'):
+            self.sprite_thread.cancel()
+        if hasattr(self, 'thumbnail_thread'):
+            self.thumbnail_thread.close_file()
         self.check_export_ready()
         self.statusBar().showMessage("준비 완료")
 
@@ -1940,51 +2698,45 @@ class MainWindow(QMainWindow):
     def jump_to_start(self):
         if getattr(self, 'is_multi_merge_mode', False): return
         if not self.file_path: return
-        starts = [s[0] for s in self.segments]
         # 현재 활성화된(저장 대기 중인) 설정 구간이 있다면 포함
-        if self.start_time != 0 or self.end_time != 0:
-            starts.append(self.start_time)
+        active = [self.start_time] if (self.start_time != 0 or self.end_time != 0) else []
             
-        if not starts:
+        if not self.segments and not active:
             self.set_position(self.start_time)
             return
             
-        starts = sorted(list(set(starts)))
         current_pos = self._mpv_pos_ms()
         
         # 현재 위치보다 큰(오른쪽에 있는) 첫 번째 시작점 찾기 (약간의 오차 무시 위해 50ms 추가)
-        next_start = next((s for s in starts if s > current_pos + 50), None)
+        candidates = [s for s in [self.segments.next_start_after(current_pos + 50)] + active
+                      if s is not None and s > current_pos + 50]
         
-        if next_start is not None:
-            self.set_position(next_start)
+        if candidates:
+            self.set_position(min(candidates))
         else:
             # 더 이상 우측에 시작점이 없으면 가장 처음(리스트의 첫 번째) 시작점으로 루프
-            self.set_position(starts[0])
+            self.set_position(min(s for s in [self.segments.first_start()] + active if s is not None))
 
     def jump_to_end(self):
         if getattr(self, 'is_multi_merge_mode', False): return
         if not self.file_path: return
-        ends = [s[1] for s in self.segments]
         # 현재 활성화된 끝점이 있다면 포함
-        if self.end_time > 0:
-            ends.append(self.end_time)
+        active = [self.end_time] if self.end_time > 0 else []
             
-        if not ends:
-            if self.end_time > 0:
-                self.set_position(self.end_time)
+        if not self.segments and not active:
             return
             
-        ends = sorted(list(set(ends)))
         current_pos = self._mpv_pos_ms()
         
         # 현재 위치보다 큰(오른쪽에 있는) 첫 번째 끝점 찾기
-        next_end = next((e for e in ends if e > current_pos + 50), None)
+        candidates = [e for e in [self.segments.next_end_after(current_pos + 50)] + active
+                      if e is not None and e > current_pos + 50]
         
-        if next_end is not None:
-            self.set_position(next_end)
+        if candidates:
+            self.set_position(min(candidates))
         else:
             # 더 이상 우측에 끝점이 없으면 가장 처음 끝점으로 루프
-            self.set_position(ends[0])
+            self.set_position(min(e for e in [self.segments.first_end()] + active if e is not None))
 
     def slider_pressed(self):
         self.is_slider_pressed = True
@@ -2011,11 +2763,11 @@ class MainWindow(QMainWindow):
 
     def position_changed(self, position):
         if not self.is_slider_pressed:
-            self.slider.setValue(position)
+            self.slider.set_playhead(position)
             
         # 다중 병합 미리보기 모드일 때, 영상 재생이 거의 끝나가면 다음 영상으로 전환
-        if self.is_multi_merge_mode and self._mpv_dur_ms() > 0:
-            if position >= self._mpv_dur_ms() - 100: # 100ms 오차 허용
+        if self.is_multi_merge_mode and self._mpv_duration_ms > 0:
+            if position >= self._mpv_duration_ms - 100: # 100ms 오차 허용
                 next_idx = self.multi_merge_play_idx + 1
                 if next_idx < len(self.multi_merge_files):
                     self._play_queue_index(next_idx)
@@ -2025,12 +2777,13 @@ class MainWindow(QMainWindow):
         self.update_time_label()
 
     def duration_changed(self, duration):
-        self.slider.setRange(0, duration)
+        self.slider.set_duration(duration)
         self.update_time_label()
 
     def update_time_label(self):
-        current = self.format_time(self._mpv_pos_ms())
-        total = self.format_time(self._mpv_dur_ms())
+        # Uses the values last reported by the mpv observers instead of querying mpv
+        current = self.format_time(self._mpv_position_ms)
+        total = self.format_time(self._mpv_duration_ms)
         self.time_label.setText(f"{current} / {total}")
 
     def format_time(self, ms):
@@ -2055,191 +2808,106 @@ class MainWindow(QMainWindow):
         except:
             return 0
 
-    def _mpv_poll(self):
-        """Timer-based polling to replace Qt media player signals."""
+    def _on_mpv_properties(self):
+        """Applies coalesced mpv property changes; runs on the Qt thread only when something changed."""
+        values = self._mpv_bridge.take()
         if not hasattr(self, 'player') or self.player is None:
             return
         if not getattr(self, 'file_path', None):
             return
         try:
-            pos_ms = self._mpv_pos_ms()
-            dur_ms = self._mpv_dur_ms()
-            if dur_ms > 0 and self.slider.maximum() != dur_ms:
-                self.duration_changed(dur_ms)
-            self.position_changed(pos_ms)
-            is_paused = True
-            try:
-                p = self.player.pause
+            if "duration" in values:
+                d = values["duration"]
+                self._mpv_duration_ms = int(d * 1000) if d is not None else 0
+                if self._mpv_duration_ms > 0 and self.slider.duration != self._mpv_duration_ms:
+                    self.duration_changed(self._mpv_duration_ms)
+            if "time-pos" in values:
+                tp = values["time-pos"]
+                self._mpv_position_ms = int(tp * 1000) if tp is not None else 0
+                self.position_changed(self._mpv_position_ms)
+            if "pause" in values:
+                p = values["pause"]
                 is_paused = p if p is not None else True
-            except:
-                pass
-            if is_paused != self._mpv_prev_pause_state:
-                self._mpv_prev_pause_state = is_paused
-                self.media_state_changed(not is_paused)
+                if is_paused != self._mpv_prev_pause_state:
+                    self._mpv_prev_pause_state = is_paused
+                    self.media_state_changed(not is_paused)
         except:
             pass
 
     def update_segments_list(self):
-        self.segments_list.clear()
-        
-        # 우선 현재 마킹 중인 (저장 대기) 구간 표시
+        # 저장된 구간은 모델에 직접 삽입/삭제되므로, 여기서는 현재 마킹 중인 (저장 대기) 구간 행만 갱신
         if self.start_time > 0 or self.end_time > 0:
-            start_str = self.format_time(self.start_time) if self.start_time > 0 else "00:00:00"
-            end_str = self.format_time(self.end_time) if self.end_time > 0 else "미지정"
-            text = f"> 현재 활성화: {start_str} ~ {end_str}"
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 32))
-            item.setData(Qt.ItemDataRole.UserRole, int(self.start_time))
-            self.segments_list.addItem(item)
-            widget = SegmentItemWidget(text, item, self)
-            self.segments_list.setItemWidget(item, widget)
-            
-        # 저장된 전체 구간 리스트 표시
-        for i, (s, e) in enumerate(self.segments):
-            text = f"구간 {i+1}: {self.format_time(s)} ~ {self.format_time(e)}"
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 32))
-            item.setData(Qt.ItemDataRole.UserRole, int(s))
-            self.segments_list.addItem(item)
-            widget = SegmentItemWidget(text, item, self)
-            self.segments_list.setItemWidget(item, widget)
-
-    def seek_to_segment(self, item):
-        start_ms = item.data(Qt.ItemDataRole.UserRole)
-        # Type casting to int to be safe
+            self.segments_list_model.set_active((self.start_time, self.end_time))
+        else:
+            self.segments_list_model.set_active(None)
+
+    def seek_to_segment(self, index):
+        start_ms = index.data(SegmentListModel.StartRole)
         try:
             start_ms = int(start_ms) if start_ms is not None else None
         except (ValueError, TypeError):
             start_ms = None
             
-        # Fallback parsing directly from the item's text if UserRole failed to retrieve
-        if start_ms is None:
-            widget = self.segments_list.itemWidget(item)
-            text = widget.label.text() if (widget and hasattr(widget, 'label')) else item.text()
-            # 예: "구간 1: 00:00:10 ~ 00:00:20" 또는 "> 현재 활성화: 00:00:10 ~ 미지정"
-            if ": " in text and " ~ " in text:
-                try:
-                    time_part = text.split(": ", 1)[1].split(" ~ ")[0]
-                    parts = time_part.split(":")
-                    if len(parts) == 3:
-                        h, m, s = map(int, parts)
-                        start_ms = (h * 3600 + m * 60 + s) * 1000
-                except Exception:
-                    pass
-            
         if start_ms is not None and self.file_path:
             self.set_position(start_ms)
             self.slider.setValue(start_ms)
             self.statusBar().showMessage(f"구간 시작점으로 이동: {self.format_time(start_ms)}")
 
     def delete_selected_segment(self):
-        selected_items = self.segments_list.selectedItems()
-        if not selected_items: return
-        self.delete_segment_by_obj(selected_items[0])
+        index = self.segments_list.currentIndex()
+        if not index.isValid(): return
+        self.delete_segment_row(index.row())
 
-    def delete_segment_by_obj(self, item):
-        row = self.segments_list.row(item)
-        if row == -1: return
-        widget = self.segments_list.itemWidget(item)
-        text = widget.label.text() if (widget and hasattr(widget, 'label')) else item.text()
+    def delete_segment_row(self, row):
+        if not (0 <= row < self.segments_list_model.rowCount()): return
+        position = self.segments_list_model.segment_position(row)
         
-        if "> 현재 활성화" in text:
+        if position < 0:
             # 현재 활성화된 마커 취소
             self.start_time = 0
             self.end_time = 0
             self.slider.set_current_selection(-1, -1)
             self.statusBar().showMessage("현재 임시 설정 구간이 취소/삭제 되었습니다.")
         else:
-            # 저장된 구간 삭제. offset 확인 필요.
-            list_idx = row
-            if self.segments_list.count() > len(self.segments):
-                # 활성화 마커가 맨 윗줄에 표시되는 경우
-                list_idx -= 1
-                
-            if 0 <= list_idx < len(self.segments):
-                self.segments.pop(list_idx)
-                self.slider.set_segments(self.segments)
-                self.statusBar().showMessage(f"구간 {list_idx+1} 항목이 삭제되었습니다.")
+            self.segments_list_model.remove_segment(position)
+            self.slider.set_segments(self.segments)
+            self.statusBar().showMessage(f"구간 {position+1} 항목이 삭제되었습니다.")
 
         self.update_segments_list()
         self.check_export_ready()
 
-    def _refresh_merge_queue_ui(self):
-        self.merge_queue_list.clear()
-        for i, f in enumerate(self.multi_merge_files):
-            item = QListWidgetItem()
-            item.setSizeHint(QSize(0, 32))
-            item.setData(Qt.ItemDataRole.UserRole, f)
-            self.merge_queue_list.addItem(item)
-            
-            widget = MergeItemWidget(f"{i+1}. {os.path.basename(f)}", item, self)
-            
-            # Disable Up on the first item, Down on the last item
-            if i == 0:
-                widget.btn_up.setEnabled(False)
-            if i == len(self.multi_merge_files) - 1:
-                widget.btn_down.setEnabled(False)
-                
-            self.merge_queue_list.setItemWidget(item, widget)
-            
-            if self.multi_merge_play_idx == i:
-                self.merge_queue_list.setCurrentItem(item)
-
-    def sync_merge_queue(self, parent, start, end, destination, row):
-        new_files = []
-        for i in range(self.merge_queue_list.count()):
-            item = self.merge_queue_list.item(i)
-            file_path = item.data(Qt.ItemDataRole.UserRole)
-            new_files.append(file_path)
-            
-        self.multi_merge_files = new_files
-        
-        if self.file_path in self.multi_merge_files:
-            self.multi_merge_play_idx = self.multi_merge_files.index(self.file_path)
+    @property
+    def multi_merge_files(self):
+        return self.merge_queue_model.files
+
+    def _sync_merge_play_index(self, *args):
+        if self._merge_play_index.isValid():
+            self.multi_merge_play_idx = self._merge_play_index.row()
         else:
             self.multi_merge_play_idx = -1
-            
-        QTimer.singleShot(0, self._refresh_merge_queue_ui)
-
-    def move_queue_item_up(self, item):
-        row = self.merge_queue_list.row(item)
-        if row > 0:
-            self.multi_merge_files[row-1], self.multi_merge_files[row] = self.multi_merge_files[row], self.multi_merge_files[row-1]
-            if self.multi_merge_play_idx == row:
-                self.multi_merge_play_idx = row - 1
-            elif self.multi_merge_play_idx == row - 1:
-                self.multi_merge_play_idx = row
-            self._refresh_merge_queue_ui()
-
-    def move_queue_item_down(self, item):
-        row = self.merge_queue_list.row(item)
-        if row >= 0 and row < len(self.multi_merge_files) - 1:
-            self.multi_merge_files[row], self.multi_merge_files[row+1] = self.multi_merge_files[row+1], self.multi_merge_files[row]
-            if self.multi_merge_play_idx == row:
-                self.multi_merge_play_idx = row + 1
-            elif self.multi_merge_play_idx == row + 1:
-                self.multi_merge_play_idx = row
-            self._refresh_merge_queue_ui()
-
-    def delete_queue_item_by_obj(self, item):
-        row = self.merge_queue_list.row(item)
-        if row >= 0:
-            del self.multi_merge_files[row]
-            if self.multi_merge_play_idx == row:
-                self.stop_playback()
-                self.multi_merge_play_idx = -1
-                self.setWindowTitle("MKV Lossless Cutter - 다중 파일 병합 모드")
-            elif self.multi_merge_play_idx > row:
-                self.multi_merge_play_idx -= 1
-            self._refresh_merge_queue_ui()
-            self.check_export_ready()
+
+    def on_merge_queue_button(self, name, row):
+        if name == "list_up":
+            self.merge_queue_model.move_file(row, -1)
+        elif name == "list_down":
+            self.merge_queue_model.move_file(row, 1)
+        elif name == "list_delete":
+            self.delete_queue_row(row)
+
+    def delete_queue_row(self, row):
+        if not (0 <= row < len(self.multi_merge_files)): return
+        was_playing = self.multi_merge_play_idx == row
+        self.merge_queue_model.remove_file(row)
+        if was_playing:
+            self.stop_playback()
+            self.setWindowTitle("MKV Lossless Cutter - 다중 파일 병합 모드")
+        self.check_export_ready()
 
     def delete_merge_queue_item(self):
         if not self.is_multi_merge_mode: return
-        selected_items = self.merge_queue_list.selectedItems()
-        if not selected_items: return
-        item = selected_items[0]
-        self.delete_queue_item_by_obj(item)
+        index = self.merge_queue_list.currentIndex()
+        if not index.isValid(): return
+        self.delete_queue_row(index.row())
         
     def filter_by_type(self, text):
         self._updating_all_tracks = True
@@ -2337,8 +3005,14 @@ class MainWindow(QMainWindow):
             self.export_btn.setText("내보내기")
             return
 
+        if not getattr(self, 'tracks_loaded', False):
+            self.export_btn.setEnabled(False)
+            self.export_btn.setText("트랙 분석 중...")
+            return
+
         ready = False
         
+        self.smart_cut_checkbox.setEnabled(len(self.segments) > 0)
         if len(self.segments) > 0:
             ready = True
             if len(self.segments) > 1:
@@ -2346,9 +3020,11 @@ class MainWindow(QMainWindow):
             else:
                 self.merge_checkbox.setEnabled(False)
                 self.merge_checkbox.setChecked(False)
+                self.resumable_checkbox.setChecked(False)
         else:
             self.merge_checkbox.setEnabled(False)
             self.merge_checkbox.setChecked(False)
+            self.resumable_checkbox.setChecked(False)
             
             # 구간 자르기가 없을 경우, 트랙 선택창 변화(일부 해제) 감지
             all_checked = True
@@ -2385,11 +3061,25 @@ class MainWindow(QMainWindow):
              QMessageBox.warning(self, "경고", "끝점은 시작점보다 뒤에 있어야 합니다.")
              return
         
+        # 기존 구간과 겹치면 저장 전에 확인 (겹친 구간은 각각 따로 내보내지고, 병합 시 겹친 부분이 중복됨)
+        overlaps = self.segments.overlapping(self.start_time, current_pos)
+        if overlaps:
+            numbers = ", ".join(str(i + 1) for i in overlaps)
+            reply = QMessageBox.question(
+                self, "구간 겹침",
+                f"새 구간이 기존 구간 {numbers}와(과) 겹칩니다.\n"
+                "겹친 부분은 결과물에 중복으로 포함됩니다. 그래도 저장할까요?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+
         self.end_time = current_pos
         self.update_segments_list()
         
-        # Save the segment
-        self.segments.append((self.start_time, self.end_time))
+        # Save the segment (kept sorted by start time)
+        saved_index = self.segments_list_model.add_segment(self.start_time, self.end_time)
         self.slider.set_segments(self.segments)
         self.slider.set_current_selection(-1, -1) # Clear current selection visual after saving
         
@@ -2399,10 +3089,11 @@ class MainWindow(QMainWindow):
         self.update_segments_list()
         
         self.check_export_ready()
-        self.statusBar().showMessage(f"구간 임시 저장됨: {self.format_time(self.segments[-1][0])} ~ {self.format_time(self.segments[-1][1])}")
+        saved_start, saved_end = self.segments[saved_index]
+        self.statusBar().showMessage(f"구간 {saved_index+1} 임시 저장됨: {self.format_time(saved_start)} ~ {self.format_time(saved_end)}")
     def clear_segments(self):
         if getattr(self, 'is_multi_merge_mode', False): return
-        self.segments = []
+        self.segments_list_model.reset_segments()
         self.start_time = 0
         self.end_time = 0
         self.slider.set_segments(self.segments)
@@ -2417,34 +3108,8 @@ class MainWindow(QMainWindow):
         total_duration = self._mpv_dur_ms()
         if total_duration <= 0: return
 
-        if not self.segments:
-            # 선택 영역이 없으면 전체를 선택
-            self.segments = [(0, total_duration)]
-        else:
-            # 겹치는 구간 병합 후 역순 구간 계산
-            sorted_segs = sorted(self.segments, key=lambda x: x[0])
-            merged = []
-            for s in sorted_segs:
-                if not merged:
-                    merged.append(s)
-                else:
-                    last = merged[-1]
-                    if s[0] <= last[1]:
-                        merged[-1] = (last[0], max(last[1], s[1]))
-                    else:
-                        merged.append(s)
-            
-            new_segments = []
-            curr_time = 0
-            for s, e in merged:
-                if s > curr_time:
-                    new_segments.append((curr_time, s))
-                curr_time = max(curr_time, e)
-            
-            if curr_time < total_duration:
-                new_segments.append((curr_time, total_duration))
-                
-            self.segments = new_segments
+        # 겹치는 구간 병합 후 역순 구간 계산 (선택 영역이 없으면 전체를 선택)
+        self.segments_list_model.reset_segments(self.segments.complement(total_duration))
             
         self.slider.set_segments(self.segments)
         self.update_segments_list()
@@ -2452,9 +3117,10 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("선택 영역이 반전되었습니다.")
 
 
-    def load_tracks_to_table(self, file_path):
+    def load_tracks_to_table(self, file_path, tracks=None):
         self.tracks_table.setRowCount(0)
-        tracks = video_cutter.get_media_tracks(file_path)
+        if tracks is None:
+            tracks = video_cutter.get_media_tracks(file_path)
         self.tracks_table.setRowCount(len(tracks))
         
         for row, track in enumerate(tracks):
@@ -2497,6 +3163,13 @@ class MainWindow(QMainWindow):
 
     def export_video(self):
         if self.is_multi_merge_mode and len(self.multi_merge_files) > 1:
+            report = self.merge_compatibility_report()
+            if report is None:
+                # Export resumes from on_batch_probe_ready once the queue is analysed
+                self.merge_export_pending = True
+                self.statusBar().showMessage("병합 대기열 파일 정보를 분석하는 중입니다. 완료되면 병합을 시작합니다...")
+                return
+
             extensions = {os.path.splitext(f)[1].lower() for f in self.multi_merge_files}
             if len(extensions) > 1:
                 msg_box = QMessageBox(self)
@@ -2512,6 +3185,30 @@ class MainWindow(QMainWindow):
                 if msg_box.clickedButton() == btn_cancel:
                     return
 
+            if report['verdict'] != video_cutter.CONCAT_COPY:
+                verdict_labels = {video_cutter.CONCAT_REMUX: "재먹싱 필요", video_cutter.CONCAT_REENCODE: "재인코딩 필요"}
+                lines = [f"[{verdict_labels[f['verdict']]}] {os.path.basename(f['path'])}: {'; '.join(f['issues'])}"
+                         for f in report['files'] if f['verdict'] != video_cutter.CONCAT_COPY]
+                shown = "\n".join(lines[:10])
+                if len(lines) > 10:
+                    shown += f"\n... 외 {len(lines) - 10}건"
+                if report['verdict'] == video_cutter.CONCAT_REENCODE:
+                    summary = "일부 파일의 스트림 구성 또는 코덱 설정이 첫 번째 파일과 다릅니다.\n무손실 병합 결과가 재생되지 않거나 손상될 가능성이 높습니다."
+                else:
+                    summary = "일부 파일의 타임베이스, 코덱 헤더 또는 컨테이너가 첫 번째 파일과 다릅니다.\n병합된 영상의 이음새에서 재생 오류가 발생할 수 있습니다."
+                msg_box = QMessageBox(self)
+                msg_box.setIcon(QMessageBox.Icon.Warning)
+                msg_box.setWindowTitle("경고: 병합 호환성 문제")
+                msg_box.setText(f"{summary}\n\n{shown}\n\n강제로 병합을 진행하시겠습니까?")
+                
+                btn_yes = msg_box.addButton("강제 병합", QMessageBox.ButtonRole.YesRole)
+                btn_cancel = msg_box.addButton("병합 취소", QMessageBox.ButtonRole.RejectRole)
+                msg_box.setDefaultButton(btn_cancel)
+                
+                msg_box.exec()
+                if msg_box.clickedButton() == btn_cancel:
+                    return
+
             first_file = self.multi_merge_files[0]
             dir_name = os.path.dirname(first_file)
             base_name, ext = os.path.splitext(os.path.basename(first_file))
@@ -2521,13 +3218,11 @@ class MainWindow(QMainWindow):
             desc = "Audio Files" if ext in ['.m4a', '.mp3', '.mka', '.aac', '.flac', '.wav', '.ogg'] else "Subtitle Files" if ext in ['.srt', '.mks', '.ass', '.vtt'] else "Video Files"
             output_path, _ = QFileDialog.getSaveFileName(self, "병합 파일 저장", default_output, f"{desc} (*{ext});;All Files (*)")
             if output_path:
-                cmd, lst_file = video_cutter.build_merge_cmd(self.multi_merge_files, output_path)
-                if not cmd:
-                    QMessageBox.critical(self, "실패", lst_file)
+                tasks, error = video_cutter.build_merge_tasks(self.multi_merge_files, output_path)
+                if not tasks:
+                    QMessageBox.critical(self, "실패", error)
                     return
-                # Multi-merge specific progress
-                tasks = [{'cmd': cmd, 'desc': "다중 파일 병합 중...", 'duration_ms': 0, 'cleanup_file': lst_file, 'output': output_path}]
-                self.start_export_worker(tasks, [output_path])
+                self.start_export_worker(tasks, [output_path], output_path)
             return
             
         has_segments = len(self.segments) > 0
@@ -2555,6 +3250,10 @@ class MainWindow(QMainWindow):
 
         if not self.file_path or (not has_segments and not (has_track_changes and any_checked)):
             return
+        if not getattr(self, 'tracks_loaded', False):
+            return # Tracks still being probed; check_export_ready keeps the button disabled meanwhile
+        if self.tracks_table.rowCount() == 0:
+            selected_track_ids = None # Probe failed: keep every track rather than ffmpeg's default pick
 
         dir_name = os.path.dirname(self.file_path)
         base_name, original_ext = os.path.splitext(os.path.basename(self.file_path))
@@ -2590,53 +3289,45 @@ class MainWindow(QMainWindow):
         output_path, _ = QFileDialog.getSaveFileName(self, "저장할 파일 선택", default_output, f"{desc} (*{ext});;All Files (*)")
         
         if output_path:
-            output_dir = os.path.dirname(output_path)
-            output_base, output_ext = os.path.splitext(os.path.basename(output_path))
-            
-            process_segments = self.segments if has_segments else [(0, self._mpv_dur_ms())]
-            total = len(process_segments)
-            do_merge = self.merge_checkbox.isChecked() and total > 1
-            
-            tasks = []
-            generated_files = []
-            
-            for i, (start_idx, end_idx) in enumerate(process_segments):
-                duration_ms = max(0, end_idx - start_idx)
-                
-                if do_merge:
-                    current_output = os.path.join(output_dir, f"{output_base}_temp_part{i+1}{output_ext}")
-                elif total > 1:
-                    current_output = os.path.join(output_dir, f"{output_base}_{i+1}{output_ext}")
-                else:
-                    current_output = output_path
-                    
-                generated_files.append(current_output)
-                cmd = video_cutter.build_cut_cmd(self.file_path, start_idx, end_idx, current_output, selected_track_ids)
-                tasks.append({
-                    'cmd': cmd,
-                    'desc': f"구간 내보내기 중... ({i+1}/{total})",
-                    'duration_ms': duration_ms,
-                    'output': current_output
-                })
-                
-            if do_merge:
-                merged_output_path = output_path
-                merge_cmd, lst_file = video_cutter.build_merge_cmd(generated_files, merged_output_path)
-                tasks.append({
-                    'cmd': merge_cmd,
-                    'desc': "조각 파일 묶음 병합 중...",
-                    'duration_ms': 100, # Small padding for merge time
-                    'cleanup_file': lst_file,
-                    'output': merged_output_path,
-                    'generated_temp_files': generated_files # We need to delete these after
-                })
-            
-            self.start_export_worker(tasks, generated_files if do_merge else [])
-
-    def start_export_worker(self, tasks, temp_files_created):
+            process_segments = list(self.segments) if has_segments else [(0, self._mpv_dur_ms())]
+            tasks, temp_files, message = video_cutter.build_export_tasks(
+                self.file_path, process_segments, output_path, selected_track_ids,
+                merge=self.merge_checkbox.isChecked(),
+                keyframes=self.keyframes,
+                smart_cut=has_segments and self.smart_cut_checkbox.isChecked(),
+                resumable=self.resumable_checkbox.isChecked()
+            )
+            if not tasks:
+                QMessageBox.critical(self, "실패", message)
+                return
+            if message:
+                QMessageBox.warning(self, "정밀 자르기 불가", message)
+            self.start_export_worker(tasks, temp_files, output_path)
+
+    def open_export_journal(self, output_path):
+        """
+        Opens the journal of an earlier, interrupted export to output_path.
+        Asks whether to resume it; starting over discards the old records.
+        """
+        journal = export_journal.ExportJournal(export_journal.journal_path_for(output_path))
+        if len(journal):
+            reply = QMessageBox.question(
+                self, "이어서 내보내기",
+                f"이전에 중단된 내보내기 기록이 있습니다 (완료된 작업 {len(journal)}개).\n"
+                "완료된 부분은 건너뛰고 이어서 진행할까요?\n\n"
+                "'아니요'를 누르면 처음부터 다시 내보냅니다.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.Yes
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                journal.discard()
+        return journal
+
+    def start_export_worker(self, tasks, temp_files_created, output_path):
         self.play_button.setEnabled(False)
         self.export_btn.setEnabled(False)
         self.temp_files_created_by_worker = temp_files_created # to clean up if cancelled/finished
+        self.export_journal = self.open_export_journal(output_path)
         
         # Create Progress Dialog
         self.progress_dialog = QProgressDialog("작업을 준비 중...", "취소", 0, 100, self)
@@ -2645,37 +3336,57 @@ class MainWindow(QMainWindow):
         self.progress_dialog.setMinimumDuration(0)
         self.progress_dialog.setValue(0)
         
-        self.export_worker = ExportWorker(tasks, self)
+        self.export_worker = ExportWorker(tasks, self, journal=self.export_journal)
         self.export_worker.progress.connect(self.progress_dialog.setValue)
-        self.export_worker.log.connect(self.progress_dialog.setLabelText)
+        self.export_desc = "작업을 준비 중..."
+        self.export_worker.log.connect(self.on_export_log)
+        self.export_worker.stats.connect(self.on_export_stats)
         self.export_worker.finished.connect(self.on_export_finished)
         self.progress_dialog.canceled.connect(self.export_worker.cancel)
         
         self.export_worker.start()
 
+    def on_export_log(self, desc):
+        self.export_desc = desc
+        self.progress_dialog.setLabelText(desc)
+
+    def on_export_stats(self, stats):
+        """Shows written size, throughput, encode speed and ETA under the current task."""
+        size_mb = stats['bytes'] / (1024 * 1024)
+        details = [f"{size_mb:.1f} MB", f"{stats['throughput'] / (1024 * 1024):.1f} MB/s"]
+        if stats['speed']:
+            details.append(f"{stats['speed']:.1f}x")
+        if stats['eta'] is not None:
+            details.append(f"남은 시간 {self.format_time(int(stats['eta'] * 1000))}")
+        self.progress_dialog.setLabelText(f"{self.export_desc}\n" + " · ".join(details))
+
     def on_export_finished(self, success, outputs, msg):
         self.play_button.setEnabled(True)
         self.progress_dialog.close()
         
-        # Clean up intermediate files from merge step
-        if hasattr(self, 'temp_files_created_by_worker'):
-            if success:
-                # Need to manually clean chunks if everything succeeded but it was a merge
-                if any('temp_part' in f for f in self.temp_files_created_by_worker):
-                    for f in self.temp_files_created_by_worker:
-                        if os.path.exists(f): 
-                            try: os.remove(f)
-                            except: pass
-            else:
-                # If cancelled, remove all partial files
-                for f in outputs:
-                    if os.path.exists(f): 
-                        try: os.remove(f)
-                        except: pass
+        journal = self.export_journal
+        if success:
+            journal.discard()
+            # Need to manually clean chunks if everything succeeded but it was a merge
+            if any('temp_part' in f for f in self.temp_files_created_by_worker):
                 for f in self.temp_files_created_by_worker:
                     if os.path.exists(f): 
                         try: os.remove(f)
                         except: pass
+        elif len(journal):
+            # Keep finished outputs (and merge parts) for the next run; only the interrupted ones are incomplete
+            for f in self.export_worker.failed_outputs:
+                if os.path.exists(f): 
+                    try: os.remove(f)
+                    except: pass
+            msg += "\n\n완료된 부분은 보존되었습니다. 같은 위치로 다시 내보내면 이어서 진행합니다."
+        else:
+            # Nothing finished, remove all partial files
+            journal.discard()
+            for f in outputs + self.temp_files_created_by_worker:
+                if os.path.exists(f): 
+                    try: os.remove(f)
+                    except: pass
         
         self.check_export_ready() # Sync the button state properly!
         
@@ -2691,9 +3402,6 @@ class MainWindow(QMainWindow):
         self.time_label.setText("오류 발생")
 
     def closeEvent(self, event):
-        if hasattr(self, '_mpv_timer'):
-            self._mpv_timer.stop()
-            
         if hasattr(self, 'player'):
             try:
                 self.player.terminate()
@@ -2701,10 +3409,27 @@ class MainWindow(QMainWindow):
                 pass
             
         if hasattr(self, 'thumbnail_thread'):
+            self.thumbnail_thread.log_stats(self.file_path)
             self.thumbnail_thread.stop()
+
+        if hasattr(self, 'keyframe_thread'):
+            self.keyframe_thread.stop()
+
+        if hasattr(self, 'sprite_thread'):
+            self.sprite_thread.stop()
+
+        if hasattr(self, 'probe_service'):
+            self.probe_service.stop()
             
         QApplication.processEvents() # Let Qt internal threads process the stop
         
         if hasattr(self, 'export_worker') and self.export_worker.isRunning():
+            # Stop ffmpeg but leave finished outputs and the journal for the next export to resume
+            self.export_worker.finished.disconnect()
             self.export_worker.cancel()
+            self.export_worker.wait(3000)
+            for f in self.export_worker.failed_outputs:
+                if os.path.exists(f):
+                    try: os.remove(f)
+                    except: pass
         super().closeEvent(event)
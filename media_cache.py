@@ -0,0 +1,203 @@
+import os
+import sys
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+APP_CACHE_NAME = "MKVLosslessEditor"
+
+def get_cache_dir(sub_dir=None):
+    """
+    Returns the per-user cache directory of the editor (created on demand).
+    Windows: %LOCALAPPDATA%\\MKVLosslessEditor, others: $XDG_CACHE_HOME or ~/.cache.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+    path = os.path.join(base, APP_CACHE_NAME)
+    if sub_dir:
+        path = os.path.join(path, sub_dir)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def file_identity(file_path):
+    """
+    Returns a stable cache key for a media file built from its absolute path, size and mtime.
+    Returns None if the file cannot be accessed.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    raw = f"{os.path.abspath(file_path)}|{st.st_size}|{st.st_mtime_ns}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+def trim_cache_dir(directory, max_bytes):
+    """
+    Evicts least recently used files (by mtime) until the directory holds at most 90%
+    of max_bytes. Returns the remaining size in bytes.
+    """
+    entries = []
+    for entry in os.scandir(directory):
+        try:
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError:
+            pass
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        return total
+    entries.sort()
+    target = max_bytes * 0.9
+    for _, size, path in entries:
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+    return total
+
+class JsonCache:
+    """
+    Key/value store with an in-memory dict in front of one JSON file per key on disk.
+    Keys are expected to come from file_identity(), so a modified source file simply
+    misses the cache instead of returning stale data.
+    Bump version when the stored format changes; entries written by older versions are ignored.
+    """
+    def __init__(self, name, version=1):
+        self.name = name
+        self.version = version
+        self._memory = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        suffix = f".v{self.version}" if self.version > 1 else ""
+        return os.path.join(get_cache_dir(self.name), f"{key}{suffix}.json")
+
+    def get(self, key):
+        if not key:
+            return None
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._memory[key] = value
+        return value
+
+    def put(self, key, value):
+        if not key:
+            return
+        with self._lock:
+            self._memory[key] = value
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing cache entry: {e}")
+            try: os.remove(tmp_path)
+            except OSError: pass
+
+class ThumbnailCache:
+    """
+    Bounded thumbnail store: in-memory LRU in front of a JPEG directory on disk.
+    Entries are keyed by file identity + quantized timestamp; the disk store is
+    trimmed oldest-first once it grows past max_disk_bytes.
+    """
+    def __init__(self, quantum_ms=500, max_memory_items=256, max_disk_bytes=256 * 1024 * 1024):
+        self.quantum_ms = quantum_ms
+        self.max_memory_items = max_memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = None
+        self._identity_cache = {}
+
+    def quantize(self, time_msec):
+        return int(round(time_msec / self.quantum_ms)) * self.quantum_ms
+
+    def _identity(self, file_path):
+        # os.stat per hover is cheap, but hashing is not free; remember per path+mtime
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        stamp = (st.st_size, st.st_mtime_ns)
+        cached = self._identity_cache.get(file_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        identity = file_identity(file_path)
+        self._identity_cache[file_path] = (stamp, identity)
+        return identity
+
+    def _key(self, file_path, time_msec):
+        identity = self._identity(file_path)
+        if not identity:
+            return None
+        return f"{identity}_{self.quantize(time_msec)}"
+
+    def _path(self, key):
+        return os.path.join(get_cache_dir("thumbnails"), f"{key}.jpg")
+
+    def get(self, file_path, time_msec):
+        key = self._key(file_path, time_msec)
+        if not key:
+            return None
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path) # Keep eviction order least-recently-used
+        except OSError:
+            return None
+        self._remember(key, data)
+        return data
+
+    def put(self, file_path, time_msec, data):
+        key = self._key(file_path, time_msec)
+        if not key or not data:
+            return
+        self._remember(key, data)
+        path = self._path(key)
+        try:
+            with open(path, 'wb') as f:
+                f.write(data)
+        except OSError:
+            return
+        self._account_disk(len(data))
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_items:
+                self._memory.popitem(last=False)
+
+    def _account_disk(self, added_bytes):
+        directory = get_cache_dir("thumbnails")
+        if self._disk_bytes is None:
+            self._disk_bytes = 0
+            for entry in os.scandir(directory):
+                try: self._disk_bytes += entry.stat().st_size
+                except OSError: pass
+        else:
+            self._disk_bytes += added_bytes
+        if self._disk_bytes <= self.max_disk_bytes:
+            return
+        self._disk_bytes = trim_cache_dir(directory, self.max_disk_bytes)
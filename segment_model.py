@@ -0,0 +1,109 @@
+import bisect
+
+class SegmentModel:
+    """
+    Sorted interval store for the cut segments of the current file.
+    Segments are (start_ms, end_ms) tuples ordered by start, with parallel sorted lists
+    of starts and ends, so insert/delete positions and neighbour lookups are binary
+    searches instead of re-sorting the whole list on every key press.
+    Shared by the timeline, the segment list and the exporter.
+    """
+    def __init__(self, segments=None):
+        self._segments = []
+        self._starts = []
+        self._ends = []
+        self._max_length = 0
+        if segments:
+            self.reset(segments)
+
+    def __len__(self):
+        return len(self._segments)
+
+    def __iter__(self):
+        return iter(self._segments)
+
+    def __getitem__(self, index):
+        return self._segments[index]
+
+    def __bool__(self):
+        return bool(self._segments)
+
+    def reset(self, segments):
+        self._segments = sorted((int(s), int(e)) for s, e in segments)
+        self._starts = [s for s, e in self._segments]
+        self._ends = sorted(e for s, e in self._segments)
+        self._max_length = max((e - s for s, e in self._segments), default=0)
+
+    def clear(self):
+        self.reset([])
+
+    def insertion_index(self, start, end):
+        """Returns the index add(start, end) would insert at."""
+        return bisect.bisect_right(self._segments, (int(start), int(end)))
+
+    def add(self, start, end):
+        """Inserts a segment in order. Returns its index."""
+        segment = (int(start), int(end))
+        index = self.insertion_index(*segment)
+        self._segments.insert(index, segment)
+        self._starts.insert(index, segment[0])
+        bisect.insort(self._ends, segment[1])
+        self._max_length = max(self._max_length, segment[1] - segment[0])
+        return index
+
+    def remove_at(self, index):
+        """Removes the segment at index. Returns the removed (start, end)."""
+        segment = self._segments.pop(index)
+        self._starts.pop(index)
+        del self._ends[bisect.bisect_left(self._ends, segment[1])]
+        if segment[1] - segment[0] >= self._max_length:
+            self._max_length = max((e - s for s, e in self._segments), default=0)
+        return segment
+
+    def next_start_after(self, position):
+        """Returns the first segment start > position, or None."""
+        index = bisect.bisect_right(self._starts, position)
+        return self._starts[index] if index < len(self._starts) else None
+
+    def next_end_after(self, position):
+        """Returns the first segment end > position, or None."""
+        index = bisect.bisect_right(self._ends, position)
+        return self._ends[index] if index < len(self._ends) else None
+
+    def first_start(self):
+        return self._starts[0] if self._starts else None
+
+    def first_end(self):
+        return self._ends[0] if self._ends else None
+
+    def overlapping(self, start, end):
+        """
+        Returns the indices of segments overlapping [start, end).
+        Only segments starting after start - longest_length can reach start,
+        so the scan is bounded by a binary search on both sides.
+        """
+        lo = bisect.bisect_left(self._starts, start - self._max_length)
+        hi = bisect.bisect_left(self._starts, end)
+        return [i for i in range(lo, hi) if self._segments[i][1] > start]
+
+    def merged(self):
+        """Returns the union of all segments as a sorted list of disjoint (start, end)."""
+        merged = []
+        for s, e in self._segments:
+            if merged and s <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+            else:
+                merged.append((s, e))
+        return merged
+
+    def complement(self, total_duration):
+        """Returns the gaps between segments within [0, total_duration)."""
+        gaps = []
+        curr_time = 0
+        for s, e in self.merged():
+            if s > curr_time:
+                gaps.append((curr_time, s))
+            curr_time = max(curr_time, e)
+        if curr_time < total_duration:
+            gaps.append((curr_time, total_duration))
+        return gaps
@@ -0,0 +1,373 @@
+import os
+import sys
+import time
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Machine-readable progress on stdout instead of the human "time=" status line on stderr
+PROGRESS_ARGS = ["-progress", "pipe:1", "-nostats"]
+STDERR_TAIL_LINES = 20 # Last stderr lines kept for the error message
+
+def progress_command(cmd):
+    """
+    Returns a copy of an ffmpeg command that reports progress on stdout.
+    The task's own 'cmd' is left untouched (the export journal keys on it).
+    """
+    if cmd and os.path.splitext(os.path.basename(cmd[0]))[0].lower() == "ffmpeg" and "-progress" not in cmd:
+        return cmd[:1] + PROGRESS_ARGS + cmd[1:]
+    return list(cmd)
+
+def _parse_float(value):
+    try:
+        return float(value.rstrip("x").replace("kbits/s", ""))
+    except (ValueError, AttributeError):
+        return None
+
+def read_progress(stream):
+    """
+    Parses ffmpeg's -progress key=value stream from a binary pipe.
+    Yields one dict per block (every -stats_period, 0.5s by default):
+    out_time_ms (milliseconds), total_size (bytes), speed (x realtime), bitrate (kbit/s)
+    and end (True on the final block). Unknown values ("N/A") are None.
+    """
+    block = {}
+    for raw in stream:
+        key, sep, value = raw.decode('ascii', 'replace').strip().partition("=")
+        if not sep:
+            continue
+        block[key] = value
+        if key != "progress":
+            continue
+        # out_time_ms is in microseconds as well (long-standing ffmpeg quirk); prefer out_time_us
+        out_time_us = block.get('out_time_us', block.get('out_time_ms', ''))
+        total_size = block.get('total_size', '')
+        yield {
+            'out_time_ms': int(out_time_us) / 1000 if out_time_us.lstrip('-').isdigit() else None,
+            'total_size': int(total_size) if total_size.isdigit() else None,
+            'speed': _parse_float(block.get('speed')),
+            'bitrate': _parse_float(block.get('bitrate')),
+            'end': value == "end"
+        }
+        block = {}
+
+def _drain(stream, tail):
+    """Reads a pipe to EOF so ffmpeg never blocks on it, keeping the last lines."""
+    try:
+        for raw in stream:
+            line = raw.decode('utf-8', 'replace').strip()
+            if line:
+                tail.append(line)
+    except (OSError, ValueError):
+        pass
+
+def is_rotational_storage(path):
+    """
+    Returns True if the path lives on a spinning disk.
+    Only detectable on Linux (/sys/dev/block); other platforms report False.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        target = path if os.path.exists(path) else (os.path.dirname(path) or ".")
+        st = os.stat(target)
+        dev_dir = f"/sys/dev/block/{os.major(st.st_dev)}:{os.minor(st.st_dev)}"
+        # Partitions have no queue/ of their own, the parent disk does
+        for candidate in (os.path.join(dev_dir, "queue", "rotational"),
+                          os.path.join(dev_dir, "..", "queue", "rotational")):
+            if os.path.exists(candidate):
+                with open(candidate, 'r') as f:
+                    return f.read().strip() == "1"
+    except (OSError, ValueError):
+        pass
+    return False
+
+def default_worker_count(path=None):
+    """
+    Picks how many ffmpeg processes to run at once from the core count and storage type.
+    Stream copy is light on CPU, so the count stays small; spinning disks are limited
+    to 2 so parallel reads don't degrade into seeking.
+    """
+    cpu = os.cpu_count() or 2
+    count = max(2, min(4, cpu // 2))
+    if path and is_rotational_storage(path):
+        count = 2
+    return count
+
+def task_outputs(task):
+    """
+    Returns the list of files a task writes.
+    """
+    if task.get('outputs'):
+        return list(task['outputs'])
+    return [task['output']] if task.get('output') else []
+
+def task_cleanup_files(task):
+    """
+    Returns the temporary files a task removes once it has finished.
+    """
+    files = list(task.get('cleanup_files', []))
+    if task.get('cleanup_file'):
+        files.append(task['cleanup_file'])
+    return files
+
+class TaskRunner:
+    """
+    Runs ffmpeg export tasks with bounded concurrency.
+    Each task is a dict with 'cmd', 'desc', 'duration_ms' and optionally 'output'
+    (or 'outputs' for single-pass multi-output commands), 'cleanup_file'
+    (or 'cleanup_files') and 'depends_on' (indices of tasks that must succeed first).
+    Independent tasks run in parallel; dependent tasks (e.g. the final concat)
+    start only once all of their dependencies have succeeded.
+    With a journal (export_journal.ExportJournal), finished tasks are recorded and
+    tasks a previous run already finished are skipped.
+    on_stats receives a dict with the bytes written, throughput (bytes/s), the summed
+    encode speed of running tasks and the ETA in seconds (None until it can be estimated).
+    """
+    def __init__(self, tasks, max_workers=None, on_progress=None, on_log=None, journal=None, on_stats=None):
+        self.tasks = tasks
+        if max_workers is None:
+            first_output = next((o for t in tasks for o in task_outputs(t)), None)
+            max_workers = default_worker_count(first_output)
+        self.max_workers = max(1, max_workers)
+        self.on_progress = on_progress
+        self.on_log = on_log
+        self.on_stats = on_stats
+        self.journal = journal
+        self.failed_outputs = [] # Partial outputs of failed or interrupted tasks
+        self.running = True
+        self._lock = threading.Lock()
+        self._processes = set()
+        self._task_progress = {}
+        self._task_stats = {}
+        self._total_ms = sum(t.get('duration_ms', 0) for t in tasks)
+        self._resumed_ms = 0
+        self._start_time = time.monotonic()
+
+    def _emit_progress(self):
+        if self._total_ms <= 0 or not self.on_progress:
+            return
+        with self._lock:
+            done_ms = sum(self._task_progress.values())
+        self.on_progress(min(99, int((done_ms / self._total_ms) * 100)))
+
+    def _emit_stats(self):
+        if not self.on_stats:
+            return
+        with self._lock:
+            done_ms = sum(self._task_progress.values())
+            stats = list(self._task_stats.values())
+        elapsed = max(0.001, time.monotonic() - self._start_time)
+        total_bytes = sum(s['total_size'] or 0 for s in stats)
+        # Rate of the work done in this run; tasks skipped via the journal don't count
+        rate_ms = (done_ms - self._resumed_ms) / elapsed
+        eta = None
+        if self._total_ms > 0 and rate_ms > 0:
+            eta = max(0.0, (self._total_ms - done_ms) / rate_ms / 1000)
+        self.on_stats({
+            'done_ms': done_ms,
+            'total_ms': self._total_ms,
+            'bytes': total_bytes,
+            'elapsed': elapsed,
+            'throughput': total_bytes / elapsed,
+            'speed': sum(s['speed'] or 0 for s in stats if not s['end']),
+            'eta': eta
+        })
+
+    def _run_task(self, index):
+        """
+        Runs one task to completion. Returns (ok, error_message).
+        """
+        task = self.tasks[index]
+        desc = task.get('desc', '작업 중...')
+        task_duration = task.get('duration_ms', 0)
+        if self.on_log:
+            self.on_log(desc)
+
+        try:
+            process = subprocess.Popen(
+                progress_command(task['cmd']),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            )
+        except Exception as e:
+            return False, f"{desc} 실행 실패: {e}"
+
+        with self._lock:
+            self._processes.add(process)
+
+        stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+        stderr_thread = threading.Thread(target=_drain, args=(process.stderr, stderr_tail), daemon=True)
+        stderr_thread.start()
+
+        error = None
+        try:
+            try:
+                for progress in read_progress(process.stdout):
+                    if not self.running:
+                        break
+                    with self._lock:
+                        self._task_stats[index] = progress
+                        if progress['out_time_ms'] is not None and task_duration > 0:
+                            self._task_progress[index] = min(task_duration, max(0, progress['out_time_ms']))
+                    self._emit_progress()
+                    self._emit_stats()
+            except Exception as e:
+                error = f"{desc} 진행 상황 읽기 오류: {e}"
+
+            if not self.running:
+                try:
+                    process.kill()
+                except:
+                    pass
+            process.wait()
+            stderr_thread.join(1)
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+            for cleanup_file in task_cleanup_files(task):
+                if os.path.exists(cleanup_file):
+                    try: os.remove(cleanup_file)
+                    except: pass
+
+        if process.returncode != 0 and not error and stderr_tail:
+            error = f"{desc} 에러 발생: {stderr_tail[-1]}"
+        if process.returncode == 0 and self.running:
+            if self.journal is not None:
+                self.journal.record(task, task_outputs(task))
+            with self._lock:
+                self._task_progress[index] = task_duration
+            self._emit_progress()
+            self._emit_stats()
+            return True, error
+        if not self.running:
+            return False, None
+        return False, error or f"{desc} 에러 발생"
+
+    def _discard_task(self, index, status):
+        """
+        Removes the helper files of a task that will never run (skipped after a failed
+        dependency, cancelled while pending, or already done per the journal), e.g. the
+        concat list written when the tasks were built. With a journal, finished outputs
+        of other tasks (e.g. smart cut pieces) are kept so a resumed export can skip them.
+        """
+        keep = set()
+        if self.journal is not None:
+            keep = {f for i, ok in status.items() if ok for f in task_outputs(self.tasks[i])}
+        for cleanup_file in task_cleanup_files(self.tasks[index]):
+            if cleanup_file not in keep and os.path.exists(cleanup_file):
+                try: os.remove(cleanup_file)
+                except: pass
+
+    def _journaled_tasks(self):
+        """
+        Returns the indices of tasks a previous run already finished.
+        A task whose outputs were consumed by a later step (e.g. smart cut pieces removed
+        by their mux) also counts as finished once every task depending on it is.
+        """
+        if self.journal is None:
+            return set()
+        dependents = {}
+        for index, task in enumerate(self.tasks):
+            for dep in task.get('depends_on', []):
+                dependents.setdefault(dep, []).append(index)
+        done = set()
+        # Dependencies always point backwards, so dependents are decided first
+        for index in reversed(range(len(self.tasks))):
+            task = self.tasks[index]
+            if self.journal.is_done(task, task_outputs(task)):
+                done.add(index)
+            elif dependents.get(index) and all(d in done for d in dependents[index]):
+                done.add(index)
+        return done
+
+    def run(self):
+        """
+        Schedules all tasks. Returns (success, generated_files, message).
+        On cancel, generated_files also lists the partial outputs of interrupted tasks
+        so the caller can clean them up; failed_outputs lists only those partial outputs.
+        """
+        status = {}
+        outputs = {}
+        fail_messages = []
+        pending = list(range(len(self.tasks)))
+        futures = {}
+
+        skipped = self._journaled_tasks()
+        for index in skipped:
+            task = self.tasks[index]
+            status[index] = True
+            outputs[index] = [f for f in task_outputs(task) if os.path.exists(f)]
+            self._task_progress[index] = task.get('duration_ms', 0)
+            self._resumed_ms += self._task_progress[index]
+            pending.remove(index)
+        for index in skipped:
+            self._discard_task(index, status)
+        if skipped:
+            if self.on_log:
+                self.on_log(f"이전에 완료된 작업 {len(skipped)}개 건너뜀")
+            self._emit_progress()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or futures:
+                if not self.running:
+                    for index in pending:
+                        self._discard_task(index, status)
+                    pending = []
+
+                for index in list(pending):
+                    if len(futures) >= self.max_workers:
+                        break
+                    task = self.tasks[index]
+                    deps = task.get('depends_on', [])
+                    if any(status.get(d) is False for d in deps):
+                        pending.remove(index)
+                        status[index] = False
+                        fail_messages.append(f"{task.get('desc', '작업')} 건너뜀 (선행 작업 실패)")
+                        self._discard_task(index, status)
+                    elif all(status.get(d) for d in deps):
+                        pending.remove(index)
+                        futures[pool.submit(self._run_task, index)] = index
+
+                if not futures:
+                    # Remaining tasks depend on something that can never finish
+                    for index in pending:
+                        fail_messages.append(f"{self.tasks[index].get('desc', '작업')} 건너뜀 (의존성 오류)")
+                        self._discard_task(index, status)
+                    break
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures.pop(future)
+                    try:
+                        ok, error = future.result()
+                    except Exception as e:
+                        ok, error = False, f"{self.tasks[index].get('desc', '작업')} 실행 실패: {e}"
+                    status[index] = ok
+                    if error:
+                        fail_messages.append(error)
+                    if not ok:
+                        self.failed_outputs.extend(task_outputs(self.tasks[index]))
+                    if ok or not self.running:
+                        outputs[index] = task_outputs(self.tasks[index])
+
+        generated_files = [f for i in sorted(outputs) for f in outputs[i]]
+        if not self.running:
+            return False, generated_files, "사용자에 의해 취소됨"
+        if fail_messages:
+            return False, generated_files, "\n".join(fail_messages)
+        if self.on_progress:
+            self.on_progress(100)
+        return True, generated_files, "모든 작업 완료"
+
+    def cancel(self):
+        self.running = False
+        with self._lock:
+            processes = list(self._processes)
+        for process in processes:
+            try:
+                process.kill()
+            except:
+                pass
@@ -0,0 +1,86 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import export_journal
+from export_journal import ExportJournal
+
+class ExportJournalTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.journal_path = os.path.join(self.dir, "out.mkv.journal")
+        self.output = os.path.join(self.dir, "piece.mkv")
+        self.task = {'cmd': ["ffmpeg", "-i", "in.mkv", self.output], 'desc': "piece"}
+        with open(self.output, 'wb') as f:
+            f.write(b"x" * 4096)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def recorded_journal(self):
+        ExportJournal(self.journal_path).record(self.task, [self.output])
+        return ExportJournal(self.journal_path) # Reloaded from disk
+
+    def test_recorded_task_is_done_after_reload(self):
+        journal = self.recorded_journal()
+        self.assertEqual(len(journal), 1)
+        self.assertTrue(journal.is_done(self.task, [self.output]))
+
+    def test_unknown_task_is_not_done(self):
+        journal = self.recorded_journal()
+        other = dict(self.task, cmd=self.task['cmd'] + ["-y"])
+        self.assertFalse(journal.is_done(other, [self.output]))
+
+    def test_missing_output_is_not_done(self):
+        journal = self.recorded_journal()
+        os.remove(self.output)
+        self.assertFalse(journal.is_done(self.task, [self.output]))
+
+    def test_truncated_output_is_not_done(self):
+        journal = self.recorded_journal()
+        with open(self.output, 'wb') as f:
+            f.write(b"x" * 100)
+        self.assertFalse(journal.is_done(self.task, [self.output]))
+
+    def test_replaced_output_of_same_size_is_not_done(self):
+        journal = self.recorded_journal()
+        with open(self.output, 'wb') as f:
+            f.write(b"y" * 4096)
+        self.assertFalse(journal.is_done(self.task, [self.output]))
+
+    def test_different_output_list_is_not_done(self):
+        journal = self.recorded_journal()
+        self.assertFalse(journal.is_done(self.task, [self.output, self.output + ".2"]))
+
+    def test_corrupt_line_is_ignored(self):
+        ExportJournal(self.journal_path).record(self.task, [self.output])
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"key": "cut short')
+        journal = ExportJournal(self.journal_path)
+        self.assertEqual(len(journal), 1)
+        self.assertTrue(journal.is_done(self.task, [self.output]))
+
+    def test_discard_removes_file(self):
+        journal = self.recorded_journal()
+        journal.discard()
+        self.assertEqual(len(journal), 0)
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_partial_checksum_covers_both_ends(self):
+        big = os.path.join(self.dir, "big.bin")
+        size = export_journal.CHECKSUM_CHUNK * 3
+        with open(big, 'wb') as f:
+            f.write(b"\0" * size)
+        before = export_journal.partial_checksum(big)
+        with open(big, 'r+b') as f:
+            f.seek(size - 1)
+            f.write(b"\1")
+        self.assertNotEqual(before, export_journal.partial_checksum(big))
+        self.assertIsNone(export_journal.partial_checksum(os.path.join(self.dir, "missing")))
+
+if __name__ == '__main__':
+    unittest.main()
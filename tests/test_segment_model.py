@@ -0,0 +1,46 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from segment_model import SegmentModel
+
+class SegmentModelTest(unittest.TestCase):
+    def test_segments_are_kept_in_time_order(self):
+        model = SegmentModel()
+        self.assertEqual(model.add(5000, 6000), 0)
+        self.assertEqual(model.add(1000, 2000), 0)
+        self.assertEqual(model.add(3000, 4000), 1)
+        self.assertEqual(list(model), [(1000, 2000), (3000, 4000), (5000, 6000)])
+
+    def test_remove_updates_neighbour_lookups(self):
+        model = SegmentModel([(1000, 9000), (2000, 3000)])
+        self.assertEqual(model.remove_at(0), (1000, 9000))
+        self.assertEqual(model.first_start(), 2000)
+        self.assertEqual(model.first_end(), 3000)
+        self.assertEqual(model.next_end_after(3000), None)
+        # The longest segment is gone, so a far-away range no longer reaches back to it
+        self.assertEqual(model.overlapping(8000, 8500), [])
+
+    def test_next_start_and_end_after(self):
+        model = SegmentModel([(1000, 2000), (3000, 4000)])
+        self.assertEqual(model.next_start_after(1000), 3000)
+        self.assertEqual(model.next_end_after(1500), 2000)
+        self.assertIsNone(model.next_start_after(3000))
+
+    def test_overlapping(self):
+        model = SegmentModel([(0, 10000), (2000, 3000), (20000, 21000)])
+        self.assertEqual(model.overlapping(9000, 12000), [0])
+        self.assertEqual(model.overlapping(2500, 2600), [0, 1])
+        self.assertEqual(model.overlapping(10000, 20000), []) # Touching ends don't overlap
+        self.assertEqual(model.overlapping(15000, 20500), [2])
+
+    def test_merged_and_complement(self):
+        model = SegmentModel([(1000, 3000), (2000, 4000), (6000, 7000)])
+        self.assertEqual(model.merged(), [(1000, 4000), (6000, 7000)])
+        self.assertEqual(model.complement(8000), [(0, 1000), (4000, 6000), (7000, 8000)])
+        self.assertEqual(SegmentModel().complement(5000), [(0, 5000)])
+
+if __name__ == '__main__':
+    unittest.main()
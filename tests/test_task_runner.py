@@ -0,0 +1,126 @@
+import io
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_runner import TaskRunner, read_progress, progress_command
+from export_journal import ExportJournal
+
+def write_cmd(path, text="data"):
+    return [sys.executable, "-c", f"open({path!r}, 'w').write({text!r})"]
+
+FAIL_CMD = [sys.executable, "-c", "import sys; sys.stderr.write('boom\\n'); sys.exit(1)"]
+SLEEP_CMD = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+class TaskRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.dir, name)
+
+    def test_runs_dependencies_before_dependents(self):
+        a, b = self.path("a"), self.path("b")
+        # b copies a, so it only succeeds if a has been written first
+        copy = [sys.executable, "-c", f"open({b!r}, 'w').write(open({a!r}).read())"]
+        tasks = [
+            {'cmd': write_cmd(a, "x"), 'desc': "a", 'output': a},
+            {'cmd': copy, 'desc': "b", 'output': b, 'depends_on': [0]},
+        ]
+        ok, files, message = TaskRunner(tasks, max_workers=2).run()
+        self.assertTrue(ok, message)
+        self.assertEqual(files, [a, b])
+        with open(b) as f:
+            self.assertEqual(f.read(), "x")
+
+    def test_failed_dependency_skips_dependent_and_removes_its_helper_files(self):
+        concat_list = self.path("list.txt")
+        with open(concat_list, 'w') as f:
+            f.write("file 'a'\n")
+        out = self.path("out")
+        tasks = [
+            {'cmd': FAIL_CMD, 'desc': "piece", 'output': self.path("piece")},
+            {'cmd': write_cmd(out), 'desc': "concat", 'output': out,
+             'depends_on': [0], 'cleanup_file': concat_list},
+        ]
+        ok, files, message = TaskRunner(tasks, max_workers=2).run()
+        self.assertFalse(ok)
+        self.assertIn("boom", message)
+        self.assertIn("concat 건너뜀", message)
+        self.assertFalse(os.path.exists(out))
+        self.assertFalse(os.path.exists(concat_list))
+        self.assertEqual(files, [])
+
+    def test_unsatisfiable_dependency_is_reported(self):
+        tasks = [{'cmd': write_cmd(self.path("a")), 'desc': "a", 'depends_on': [5]}]
+        ok, files, message = TaskRunner(tasks, max_workers=1).run()
+        self.assertFalse(ok)
+        self.assertIn("의존성 오류", message)
+
+    def test_cancel_kills_running_and_discards_pending_tasks(self):
+        helper = self.path("helper.txt")
+        open(helper, 'w').close()
+        tasks = [
+            {'cmd': SLEEP_CMD, 'desc': "slow", 'output': self.path("slow")},
+            {'cmd': write_cmd(self.path("late")), 'desc': "late", 'output': self.path("late"),
+             'depends_on': [0], 'cleanup_files': [helper]},
+        ]
+        runner = TaskRunner(tasks, max_workers=1,
+                            on_log=lambda desc: desc == "slow" and threading.Timer(0.2, runner.cancel).start())
+        ok, files, message = runner.run()
+        self.assertFalse(ok)
+        self.assertEqual(message, "사용자에 의해 취소됨")
+        self.assertEqual(runner.failed_outputs, [self.path("slow")])
+        self.assertFalse(os.path.exists(self.path("late")))
+        self.assertFalse(os.path.exists(helper))
+
+    def test_journal_skips_finished_tasks(self):
+        a, b = self.path("a"), self.path("b")
+        journal = ExportJournal(self.path("out.journal"))
+        tasks = [
+            {'cmd': write_cmd(a), 'desc': "a", 'output': a, 'duration_ms': 1000},
+            {'cmd': write_cmd(b), 'desc': "b", 'output': b, 'duration_ms': 1000},
+        ]
+        self.assertTrue(TaskRunner(tasks, max_workers=1, journal=journal).run()[0])
+
+        # Only the task whose output is gone runs again
+        os.remove(b)
+        logs = []
+        ok, files, message = TaskRunner(tasks, max_workers=1, on_log=logs.append,
+                                        journal=ExportJournal(self.path("out.journal"))).run()
+        self.assertTrue(ok, message)
+        self.assertIn("이전에 완료된 작업 1개 건너뜀", logs)
+        self.assertNotIn("a", logs)
+        self.assertIn("b", logs)
+
+class ProgressTest(unittest.TestCase):
+    def test_read_progress_parses_blocks(self):
+        stream = io.BytesIO(
+            b"out_time_us=1500000\ntotal_size=2048\nbitrate=1024.5kbits/s\nspeed=2.5x\nprogress=continue\n"
+            b"out_time_us=N/A\ntotal_size=N/A\nspeed=N/A\nprogress=end\n"
+        )
+        blocks = list(read_progress(stream))
+        self.assertEqual(len(blocks), 2)
+        self.assertEqual(blocks[0], {'out_time_ms': 1500.0, 'total_size': 2048, 'speed': 2.5,
+                                     'bitrate': 1024.5, 'end': False})
+        self.assertIsNone(blocks[1]['out_time_ms'])
+        self.assertIsNone(blocks[1]['total_size'])
+        self.assertIsNone(blocks[1]['speed'])
+        self.assertTrue(blocks[1]['end'])
+
+    def test_progress_command_only_touches_ffmpeg(self):
+        cmd = ["ffmpeg", "-i", "in.mkv", "out.mkv"]
+        self.assertEqual(progress_command(cmd)[:4], ["ffmpeg", "-progress", "pipe:1", "-nostats"])
+        self.assertEqual(cmd, ["ffmpeg", "-i", "in.mkv", "out.mkv"])
+        self.assertEqual(progress_command(["ffprobe", "x"]), ["ffprobe", "x"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import video_cutter
+from video_cutter import parse_time_ms, plan_smart_cut, snap_segment, check_concat_compatibility
+
+class ParseTimeTest(unittest.TestCase):
+    def test_formats(self):
+        self.assertEqual(parse_time_ms(1.5), 1500)
+        self.assertEqual(parse_time_ms("90"), 90000)
+        self.assertEqual(parse_time_ms("01:30"), 90000)
+        self.assertEqual(parse_time_ms("1:02:03.250"), 3723250)
+        self.assertEqual(parse_time_ms("250ms"), 250)
+
+    def test_rejects_bad_values(self):
+        for value in (-1, "-00:01", "1:-30", "1::2", "abc", float("nan"), float("inf"), True, "1:2:3:4"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_time_ms(value)
+
+class SmartCutPlanTest(unittest.TestCase):
+    KEYFRAMES = [0.0, 2002.0, 4004.0, 6006.0]
+
+    def test_head_copy_tail(self):
+        self.assertEqual(plan_smart_cut(self.KEYFRAMES, 1000, 5000), [
+            ("encode", 1000, 2002.0),
+            ("copy", 2002.0, 4004.0),
+            ("encode", 4004.0, 5000),
+        ])
+
+    def test_keyframe_aligned_segment_is_copied(self):
+        self.assertEqual(plan_smart_cut(self.KEYFRAMES, 2002.0, 6006.0), [("copy", 2002.0, 6006.0)])
+
+    def test_segment_without_keyframe_is_encoded(self):
+        self.assertEqual(plan_smart_cut(self.KEYFRAMES, 2500, 3500), [("encode", 2500, 3500)])
+
+    def test_snap_segment_moves_start_to_previous_keyframe(self):
+        self.assertEqual(snap_segment(self.KEYFRAMES, 3000, 5000), (2002.0, 5000))
+        # Sub-millisecond keyframes (90 kHz sources) are not rounded past the cut point
+        self.assertEqual(snap_segment([0.0, 1001.011], 1001.011, 2000), (1001.011, 2000))
+
+class ConcatCompatibilityTest(unittest.TestCase):
+    def probe(self, **video):
+        stream = {'codec_type': 'video', 'codec_name': 'h264', 'profile': 'High', 'width': 1920,
+                  'height': 1080, 'pix_fmt': 'yuv420p', 'time_base': '1/1000', 'extradata_hash': 'CRC32:1'}
+        stream.update(video)
+        audio = {'codec_type': 'audio', 'codec_name': 'aac', 'sample_rate': '48000', 'channels': 2}
+        return {'streams': [stream, audio], 'format': {'format_name': 'matroska,webm'}}
+
+    def test_identical_files_can_be_copied(self):
+        report = check_concat_compatibility(["a", "b"], [self.probe(), self.probe()])
+        self.assertEqual(report['verdict'], video_cutter.CONCAT_COPY)
+
+    def test_time_base_difference_needs_remux(self):
+        report = check_concat_compatibility(["a", "b"], [self.probe(), self.probe(time_base='1/90000')])
+        self.assertEqual(report['verdict'], video_cutter.CONCAT_REMUX)
+        self.assertEqual(report['files'][1]['verdict'], video_cutter.CONCAT_REMUX)
+
+    def test_resolution_difference_needs_reencode(self):
+        report = check_concat_compatibility(["a", "b", "c"],
+                                            [self.probe(), self.probe(width=1280), self.probe(time_base='1/90000')])
+        self.assertEqual(report['verdict'], video_cutter.CONCAT_REENCODE)
+        self.assertEqual([f['verdict'] for f in report['files']],
+                         [video_cutter.CONCAT_COPY, video_cutter.CONCAT_REENCODE, video_cutter.CONCAT_REMUX])
+
+    def test_unreadable_file_needs_reencode(self):
+        report = check_concat_compatibility(["a", "b"], [self.probe(), None])
+        self.assertEqual(report['files'][1]['verdict'], video_cutter.CONCAT_REENCODE)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,22 +1,56 @@
 import subprocess
 import os
+import sys
 import json
+import time
+import math
+import bisect
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import media_cache
+
+_keyframe_cache = media_cache.JsonCache("keyframes", version=3) # v3: relative to start_time, microsecond precision
+_sprite_cache = media_cache.JsonCache("sprites")
+_probe_cache = media_cache.JsonCache("probe", version=2) # v2: adds extradata_hash (-show_data_hash)
+
+# Sprite sheet layout: at most SPRITE_MAX_TILES tiles, never closer than 2 s apart
+SPRITE_COLUMNS = 10
+SPRITE_TILE_WIDTH = 160
+SPRITE_MAX_TILES = 400
+SPRITE_MIN_INTERVAL_MS = 2000
+SPRITE_CACHE_MAX_BYTES = 128 * 1024 * 1024 # About 1 MB per file; least recently used sheets are evicted
+
+def _creation_flags():
+    return subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
 def format_time_ffmpeg(ms):
     """
     Converts milliseconds to HH:MM:SS.mmm format for FFmpeg.
+    Fractional milliseconds (keyframe times) are kept to the microsecond: HH:MM:SS.uuuuuu.
     """
-    seconds = (ms // 1000) % 60
-    minutes = (ms // 60000) % 60
-    hours = (ms // 3600000)
-    milliseconds = ms % 1000
-    return f"{hours:02}:{minutes:02}:{seconds:02}.{milliseconds:03}"
+    us = int(round(ms * 1000))
+    seconds = (us // 1000000) % 60
+    minutes = (us // 60000000) % 60
+    hours = (us // 3600000000)
+    if us % 1000:
+        return f"{hours:02}:{minutes:02}:{seconds:02}.{us % 1000000:06}"
+    return f"{hours:02}:{minutes:02}:{seconds:02}.{(us // 1000) % 1000:03}"
 
-def get_media_tracks(file_path):
+def probe_media(file_path, use_cache=True, cancel_event=None, timeout=5):
     """
-    Uses ffprobe to extract media streams information.
-    Returns a list of dictionaries with stream details.
+    Uses ffprobe to read the full stream and container description of a file.
+    Returns the parsed ffprobe JSON ({'streams': [...], 'format': {...}}) or None on failure/cancel.
+    Results are cached by path, size and mtime, so reopening an unchanged file skips ffprobe.
+    Setting cancel_event kills a running ffprobe (used when the user switches files).
     """
+    key = media_cache.file_identity(file_path) if use_cache else None
+    cached = _probe_cache.get(key)
+    if cached is not None:
+        return cached
+    if cancel_event is not None and cancel_event.is_set():
+        return None
+
     cmd = [
         "ffprobe",
         "-v", "quiet",
@@ -24,43 +58,391 @@ def get_media_tracks(file_path):
         "-probesize", "5000000",
         "-print_format", "json",
         "-show_streams",
+        "-show_format",
+        "-show_data_hash", "CRC32", # extradata_hash per stream, for the concat precheck
         file_path
     ]
     try:
-        import sys
-        creation_flags = 0
-        if sys.platform == "win32":
-            creation_flags = subprocess.CREATE_NO_WINDOW
-            
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True, 
-            encoding='utf-8', errors='ignore', 
-            creationflags=creation_flags, timeout=5
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', errors='ignore',
+            creationflags=_creation_flags()
         )
-        data = json.loads(result.stdout)
-        streams = data.get('streams', [])
-        tracks = []
-        for stream in streams:
-            track = {
-                'id': stream.get('index'),
-                'codec': stream.get('codec_name', 'Unknown'),
-                'type': stream.get('codec_type', 'Unknown'),
-                'language': stream.get('tags', {}).get('language', 'und'),
-                'title': stream.get('tags', {}).get('title', ''),
-                'default': stream.get('disposition', {}).get('default', 0) == 1,
-                'forced': stream.get('disposition', {}).get('forced', 0) == 1
-            }
-            tracks.append(track)
-        return tracks
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                stdout, _ = proc.communicate(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                cancelled = cancel_event is not None and cancel_event.is_set()
+                if cancelled or time.monotonic() > deadline:
+                    proc.kill()
+                    proc.communicate()
+                    if not cancelled:
+                        print(f"Error extracting metadata: ffprobe timed out after {timeout}s")
+                    return None
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        data = json.loads(stdout)
     except Exception as e:
         print(f"Error extracting metadata: {e}")
+        return None
+
+    data.setdefault('streams', [])
+    data.setdefault('format', {})
+    _probe_cache.put(key, data)
+    return data
+
+def tracks_from_probe(probe):
+    """
+    Converts ffprobe stream entries into the track dictionaries used by the track table.
+    """
+    tracks = []
+    for stream in (probe or {}).get('streams', []):
+        track = {
+            'id': stream.get('index'),
+            'codec': stream.get('codec_name', 'Unknown'),
+            'type': stream.get('codec_type', 'Unknown'),
+            'language': stream.get('tags', {}).get('language', 'und'),
+            'title': stream.get('tags', {}).get('title', ''),
+            'default': stream.get('disposition', {}).get('default', 0) == 1,
+            'forced': stream.get('disposition', {}).get('forced', 0) == 1
+        }
+        tracks.append(track)
+    return tracks
+
+def get_media_tracks(file_path):
+    """
+    Uses ffprobe to extract media streams information.
+    Returns a list of dictionaries with stream details.
+    """
+    return tracks_from_probe(probe_media(file_path))
+
+def probe_many(file_paths, max_workers=None, cancel_event=None, on_progress=None):
+    """
+    Probes many files concurrently through a bounded thread pool (ffprobe is I/O bound,
+    so the pool is larger than the core count). Cached files return immediately.
+    Returns a list of probe dicts (None for failures) in the order of file_paths.
+    on_progress(done, total) is called from the worker threads.
+    """
+    unique_paths = list(dict.fromkeys(file_paths))
+    if max_workers is None:
+        max_workers = min(8, (os.cpu_count() or 2) * 2)
+    probes = {}
+    if unique_paths:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="probe") as pool:
+            futures = {pool.submit(probe_media, path, True, cancel_event): path for path in unique_paths}
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    probes[futures[future]] = future.result()
+                except Exception:
+                    probes[futures[future]] = None
+                if on_progress:
+                    on_progress(done, len(unique_paths))
+    return [probes.get(path) for path in file_paths]
+
+# Concat precheck verdicts, from cheapest to most expensive fix
+CONCAT_COPY = "copy"          # Stream copy concat is safe
+CONCAT_REMUX = "remux"        # Same codec parameters, but container-level details differ
+CONCAT_REENCODE = "reencode"  # Decoded parameters differ; the file has to be re-encoded
+_CONCAT_RANK = {CONCAT_COPY: 0, CONCAT_REMUX: 1, CONCAT_REENCODE: 2}
+
+# Stream fields that must match for the decoder to continue across the join
+_REENCODE_FIELDS = {
+    'video': ('codec_name', 'profile', 'width', 'height', 'pix_fmt', 'field_order'),
+    'audio': ('codec_name', 'profile', 'sample_rate', 'channels', 'channel_layout', 'sample_fmt'),
+}
+# Fields that only affect how the stream is wrapped (fixable by remuxing)
+_REMUX_FIELDS = ('time_base', 'extradata_hash')
+
+def describe_stream(stream):
+    """
+    Returns a short description of a stream (type, codec and main parameters).
+    """
+    codec_type = stream.get('codec_type', 'unknown')
+    desc = f"{codec_type} {stream.get('codec_name', 'unknown')}"
+    if codec_type == 'video':
+        desc += f" {stream.get('width', '?')}x{stream.get('height', '?')}"
+    elif codec_type == 'audio':
+        desc += f" {stream.get('channels', '?')}ch {stream.get('sample_rate', '?')}Hz"
+    return desc
+
+def _compare_probe(probe, reference):
+    """
+    Compares one file's probe with the reference probe.
+    Returns (verdict, issues).
+    """
+    verdict = CONCAT_COPY
+    issues = []
+
+    def flag(level, text):
+        nonlocal verdict
+        if _CONCAT_RANK[level] > _CONCAT_RANK[verdict]:
+            verdict = level
+        issues.append(text)
+
+    streams = probe.get('streams', [])
+    ref_streams = reference.get('streams', [])
+    if [st.get('codec_type') for st in streams] != [st.get('codec_type') for st in ref_streams]:
+        flag(CONCAT_REENCODE, f"스트림 구성 {len(streams)}개 ({', '.join(st.get('codec_type', '?') for st in streams)}) ≠ 기준 {len(ref_streams)}개")
+        return verdict, issues
+
+    for index, (stream, ref) in enumerate(zip(streams, ref_streams)):
+        for field in _REENCODE_FIELDS.get(stream.get('codec_type'), ('codec_name',)):
+            if stream.get(field) != ref.get(field):
+                flag(CONCAT_REENCODE, f"스트림 #{index} {field}: {stream.get(field)} ≠ 기준 {ref.get(field)}")
+        for field in _REMUX_FIELDS:
+            # Older cache entries may lack a field; only compare what both probes have
+            if field in stream and field in ref and stream[field] != ref[field]:
+                flag(CONCAT_REMUX, f"스트림 #{index} {field}: {stream[field]} ≠ 기준 {ref[field]}")
+
+    format_name = probe.get('format', {}).get('format_name')
+    ref_format_name = reference.get('format', {}).get('format_name')
+    if format_name and ref_format_name and format_name != ref_format_name:
+        flag(CONCAT_REMUX, f"컨테이너 {format_name} ≠ 기준 {ref_format_name}")
+    return verdict, issues
+
+def check_concat_compatibility(file_paths, probes):
+    """
+    Classifies a lossless concat of file_paths (with their probe_media results)
+    against the first file, before any data is written:
+      copy     - stream copy is safe
+      remux    - codec parameters match but time bases, extradata or containers differ
+      reencode - stream order or decoded parameters differ
+    Returns {'verdict': ..., 'files': [{'path', 'verdict', 'issues'}, ...]}.
+    Unreadable files are reported as reencode.
+    """
+    report = {'verdict': CONCAT_COPY, 'files': []}
+    reference = None
+    for path, probe in zip(file_paths, probes):
+        if not probe:
+            verdict, issues = CONCAT_REENCODE, ["파일 정보를 읽을 수 없음"]
+        elif reference is None:
+            reference = probe
+            verdict, issues = CONCAT_COPY, []
+        else:
+            verdict, issues = _compare_probe(probe, reference)
+        report['files'].append({'path': path, 'verdict': verdict, 'issues': issues})
+        if _CONCAT_RANK[verdict] > _CONCAT_RANK[report['verdict']]:
+            report['verdict'] = verdict
+    return report
+
+def build_keyframe_index(file_path, cancel_event=None):
+    """
+    Scans the first video stream packet by packet (no decoding) with ffprobe.
+    Returns a sorted list of keyframe timestamps in milliseconds, or [] on failure/cancel.
+    Timestamps are made relative to the container start_time, like cut times,
+    ffmpeg's -ss and mpv's time-pos (MPEG-TS and some remuxes don't start at 0).
+    They keep microsecond precision, rounded up: MP4/MPEG-TS timestamps (e.g. 90 kHz) are
+    rarely whole milliseconds, and an -ss even slightly before a keyframe seeks to the
+    keyframe before it. Values are floats; round only for display.
+    """
+    cmd = [
+        "ffprobe",
+        "-v", "quiet",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=time_base:packet=pts,flags",
+        "-print_format", "csv",
+        file_path
+    ]
+    pts_values = []
+    time_base = None
+    try:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', errors='ignore',
+            creationflags=_creation_flags()
+        )
+        for line in proc.stdout:
+            if cancel_event is not None and cancel_event.is_set():
+                proc.kill()
+                proc.wait()
+                return []
+            parts = line.strip().split(",")
+            if parts[0] == "stream" and len(parts) >= 2:
+                try:
+                    time_base = Fraction(parts[1])
+                except (ValueError, ZeroDivisionError):
+                    pass
+                continue
+            if parts[0] != "packet" or len(parts) < 3 or "K" not in parts[2]:
+                continue
+            try:
+                pts_values.append(int(parts[1]))
+            except ValueError:
+                continue # pts can be N/A
+        proc.wait()
+        if proc.returncode != 0 or not time_base:
+            return []
+    except Exception as e:
+        print(f"Error building keyframe index: {e}")
         return []
+    try:
+        # ffmpeg keeps start_time in microseconds, so the printed value is exact
+        start_us = int(round(float(probe_media(file_path)['format']['start_time']) * 1000000))
+    except (TypeError, KeyError, ValueError):
+        start_us = 0
+    # Packets are in decode order, so B-frame streams are not sorted by pts
+    keyframes_us = sorted({math.ceil(pts * time_base * 1000000) - start_us for pts in pts_values})
+    return [us / 1000 for us in keyframes_us]
+
+def get_keyframes(file_path, build=True, cancel_event=None):
+    """
+    Returns the keyframe index (sorted ms list) of a file.
+    The index is built once and cached on disk keyed by path+size+mtime.
+    With build=False only the cache is consulted (returns None on miss).
+    """
+    key = media_cache.file_identity(file_path)
+    cached = _keyframe_cache.get(key)
+    if cached is not None:
+        return cached
+    if not build:
+        return None
+
+    keyframes = build_keyframe_index(file_path, cancel_event)
+    if keyframes:
+        _keyframe_cache.put(key, keyframes)
+    return keyframes
+
+def snap_to_keyframe(keyframes, ms, direction="before"):
+    """
+    Snaps a timestamp to the keyframe index in O(log n).
+    direction: "before" (last keyframe <= ms), "after" (first keyframe >= ms) or "nearest".
+    Returns ms unchanged when there is no suitable keyframe.
+    """
+    if not keyframes:
+        return ms
+    idx = bisect.bisect_right(keyframes, ms)
+    before = keyframes[idx - 1] if idx > 0 else None
+    if before == ms:
+        return ms
+    after = keyframes[idx] if idx < len(keyframes) else None
+
+    if direction == "before":
+        return before if before is not None else ms
+    if direction == "after":
+        return after if after is not None else ms
+    candidates = [k for k in (before, after) if k is not None]
+    return min(candidates, key=lambda k: abs(k - ms))
+
+def snap_segment(keyframes, start_ms, end_ms):
+    """
+    Returns (start, end) with the start moved to the keyframe stream copy actually begins at.
+    With -ss before -i and -c copy, ffmpeg starts at the last keyframe <= start,
+    so this is where the exported clip will really start.
+    """
+    start = snap_to_keyframe(keyframes, start_ms, "before")
+    if start >= end_ms:
+        start = start_ms
+    return start, end_ms
 
-def build_cut_cmd(input_path, start_ms, end_ms, output_path, selected_track_ids=None):
+def get_media_duration_ms(file_path):
+    """
+    Returns the container duration in milliseconds (0 if unknown).
+    """
+    probe = probe_media(file_path)
+    try:
+        return int(float(probe['format']['duration']) * 1000)
+    except (TypeError, KeyError, ValueError):
+        return 0
+
+def build_sprite_sheet_cmd(input_path, interval_s, count, columns=SPRITE_COLUMNS, tile_width=SPRITE_TILE_WIDTH):
+    """
+    Builds the ffmpeg command that renders a whole-timeline sprite sheet in one
+    streaming pass: only keyframes are decoded, one tile every interval_s seconds,
+    tiled into a single JPEG written to stdout.
+    """
+    rows = max(1, -(-count // columns))
+    return [
+        "ffmpeg", "-hide_banner", "-loglevel", "quiet",
+        "-skip_frame", "nokey", # Decode keyframes only
+        "-i", input_path,
+        "-an", "-sn", "-dn",
+        "-vf", f"fps=1/{interval_s:.3f},scale={tile_width}:-2,tile={columns}x{rows}",
+        "-frames:v", "1",
+        "-q:v", "5",
+        "-f", "image2pipe",
+        "-vcodec", "mjpeg",
+        "-"
+    ]
+
+def get_sprite_sheet(file_path, cancel_event=None, on_process=None):
+    """
+    Returns (meta, jpeg_bytes) for the file's timeline sprite sheet, or (None, None).
+    meta holds interval_ms, count, columns and rows. Results are cached on disk
+    keyed by path+size+mtime, so a file is only ever decoded for this once; the
+    cache is capped at SPRITE_CACHE_MAX_BYTES, evicting least recently used sheets.
+    ffmpeg only writes the JPEG once the whole file is decoded, so cancel_event is
+    polled while waiting and kills the process; on_process(proc) lets the caller kill it too.
+    """
+    key = media_cache.file_identity(file_path)
+    if not key:
+        return None, None
+    image_path = os.path.join(media_cache.get_cache_dir("sprites"), f"{key}.jpg")
+    meta = _sprite_cache.get(key)
+    if meta is not None:
+        try:
+            with open(image_path, 'rb') as f:
+                data = f.read()
+            os.utime(image_path) # Keep eviction order least-recently-used
+            return meta, data
+        except OSError:
+            pass # Evicted: regenerate
+
+    duration_ms = get_media_duration_ms(file_path)
+    if duration_ms <= 0:
+        return None, None
+    interval_ms = max(SPRITE_MIN_INTERVAL_MS, duration_ms // SPRITE_MAX_TILES)
+    count = max(1, -(-duration_ms // interval_ms))
+    columns = min(SPRITE_COLUMNS, count)
+    meta = {
+        'interval_ms': interval_ms,
+        'count': count,
+        'columns': columns,
+        'rows': max(1, -(-count // columns))
+    }
+
+    cmd = build_sprite_sheet_cmd(file_path, interval_ms / 1000.0, count, columns)
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, creationflags=_creation_flags())
+        if on_process:
+            on_process(proc)
+        while True:
+            try:
+                data, _ = proc.communicate(timeout=0.2)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel_event is not None and cancel_event.is_set():
+                    proc.kill()
+                    proc.wait()
+                    proc.stdout.close()
+                    return None, None
+        if cancel_event is not None and cancel_event.is_set():
+            return None, None
+        if proc.returncode != 0 or not data:
+            return None, None
+    except Exception as e:
+        print(f"Error generating sprite sheet: {e}")
+        return None, None
+
+    try:
+        with open(image_path, 'wb') as f:
+            f.write(data)
+        _sprite_cache.put(key, meta)
+        media_cache.trim_cache_dir(os.path.dirname(image_path), SPRITE_CACHE_MAX_BYTES)
+    except OSError:
+        pass
+    return meta, data
+
+def build_cut_cmd(input_path, start_ms, end_ms, output_path, selected_track_ids=None, keyframes=None):
     """
     Builds the ffmpeg command for cutting the video.
+    If a keyframe index is given, the start is snapped to a real keyframe first.
     Returns the command list.
     """
+    if keyframes:
+        start_ms, end_ms = snap_segment(keyframes, start_ms, end_ms)
+
     start_str = format_time_ffmpeg(start_ms)
     end_str = format_time_ffmpeg(end_ms)
     
@@ -82,6 +464,285 @@ def build_cut_cmd(input_path, start_ms, end_ms, output_path, selected_track_ids=
     cmd.append(output_path)
     return cmd
 
+def build_multi_cut_cmd(input_path, segments, output_paths, selected_track_ids=None, keyframes=None):
+    """
+    Builds a single ffmpeg command that writes every segment to its own output,
+    so the source is opened, probed and demuxed once instead of once per segment.
+    The input is seeked to the earliest segment and read up to the last end;
+    each output then keeps only its own range (-ss/-to as output options).
+    Unlike an input seek, an output -ss with -c copy drops packets up to the first
+    keyframe at or after the start, and the gaps between segments are demuxed too,
+    so only use it when single_pass_safe() holds and the segments are close together.
+    Returns the command list.
+    """
+    if keyframes:
+        segments = [snap_segment(keyframes, s, e) for s, e in segments]
+
+    base_ms = min(s for s, e in segments)
+    last_end_ms = max(e for s, e in segments)
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-ss", format_time_ffmpeg(base_ms),
+        "-to", format_time_ffmpeg(last_end_ms),
+        "-i", input_path
+    ]
+
+    for (start_ms, end_ms), output_path in zip(segments, output_paths):
+        # Timestamps restart at 0 after the input seek, so ranges are relative to base
+        cmd.extend([
+            "-ss", format_time_ffmpeg(start_ms - base_ms),
+            "-to", format_time_ffmpeg(end_ms - base_ms),
+        ])
+        if selected_track_ids is not None:
+            for track_id in selected_track_ids:
+                cmd.extend(["-map", f"0:{track_id}"])
+        else:
+            cmd.extend(["-map", "0"])
+        cmd.extend(["-c", "copy", output_path])
+
+    return cmd
+
+def single_pass_safe(keyframes, segments):
+    """
+    True when every segment starts exactly on a known keyframe, the only case where
+    build_multi_cut_cmd starts its outputs where build_cut_cmd would.
+    Without a keyframe index (still building or failed) this is always False.
+    """
+    if not keyframes:
+        return False
+    for start_ms, end_ms in segments:
+        i = bisect.bisect_left(keyframes, start_ms)
+        if i >= len(keyframes) or keyframes[i] != start_ms:
+            return False
+    return True
+
+# Smart cut: encoders used for the re-encoded boundary pieces, per source codec
+SMART_CUT_ENCODERS = {'h264': 'libx264', 'hevc': 'libx265'}
+SMART_CUT_CRF = 16
+_SMART_CUT_PROFILES = {
+    'libx264': {'constrained baseline': 'baseline', 'baseline': 'baseline', 'main': 'main', 'high': 'high',
+                'high 10': 'high10', 'high 4:2:2': 'high422', 'high 4:4:4 predictive': 'high444'},
+    'libx265': {'main': 'main', 'main 10': 'main10', 'main still picture': 'mainstillpicture'},
+}
+
+def primary_video_stream(probe):
+    """
+    Returns the first real video stream of a probe (cover art is skipped), or None.
+    """
+    for stream in (probe or {}).get('streams', []):
+        if stream.get('codec_type') == 'video' and not stream.get('disposition', {}).get('attached_pic'):
+            return stream
+    return None
+
+def smart_cut_encoder_args(stream):
+    """
+    Returns the ffmpeg video encoding options that reproduce the source stream's
+    codec, profile, pixel format and colour description, or None if the codec is not supported.
+    """
+    encoder = SMART_CUT_ENCODERS.get(stream.get('codec_name'))
+    if not encoder:
+        return None
+    args = ["-c:v", encoder, "-crf", str(SMART_CUT_CRF), "-preset", "medium"]
+    profile = _SMART_CUT_PROFILES[encoder].get(str(stream.get('profile', '')).lower())
+    if profile:
+        args.extend(["-profile:v", profile])
+    if stream.get('pix_fmt'):
+        args.extend(["-pix_fmt", stream['pix_fmt']])
+    for option, field in (("-color_primaries", 'color_primaries'), ("-color_trc", 'color_transfer'),
+                          ("-colorspace", 'color_space'), ("-color_range", 'color_range')):
+        value = stream.get(field)
+        if value and value != "unknown":
+            args.extend([option, value])
+    return args
+
+# Keyframe times are stored rounded up to the microsecond (see build_keyframe_index)
+KEYFRAME_EPSILON_MS = 0.001
+
+def plan_smart_cut(keyframes, start_ms, end_ms):
+    """
+    Splits a segment at the keyframes inside it.
+    Returns a list of (kind, start, end) pieces where kind is "encode" for the partial
+    GOPs at the head and tail and "copy" for the keyframe-aligned interior.
+    A segment without a keyframe inside is re-encoded as a whole.
+    """
+    i = bisect.bisect_left(keyframes, start_ms)
+    first_key = keyframes[i] if i < len(keyframes) else None
+    if first_key is None or first_key >= end_ms:
+        return [("encode", start_ms, end_ms)]
+    last_key = keyframes[bisect.bisect_right(keyframes, end_ms) - 1]
+
+    pieces = []
+    if first_key > start_ms:
+        pieces.append(("encode", start_ms, first_key))
+    if last_key > first_key:
+        pieces.append(("copy", first_key, last_key))
+    if end_ms > last_key:
+        pieces.append(("encode", last_key, end_ms))
+    return pieces
+
+def has_open_gop(input_path, keyframes, video_index=0, timeout=5):
+    """
+    Checks whether the video uses open GOPs (HEVC CRA, H.264 without closed GOPs).
+    Reads the packets around a keyframe mid-file: if a packet decoded after the keyframe
+    is displayed before it, it is a leading picture referencing the previous GOP, and a
+    stream copy starting at that keyframe would begin with undecodable frames.
+    Returns True, False, or None if it could not be determined.
+    """
+    if len(keyframes) < 2:
+        return False
+    probe_at = keyframes[len(keyframes) // 2] / 1000.0
+    cmd = [
+        "ffprobe",
+        "-v", "quiet",
+        "-select_streams", str(video_index),
+        "-read_intervals", f"{probe_at:.3f}%+#120",
+        "-show_entries", "packet=pts_time,flags",
+        "-print_format", "csv=p=0",
+        input_path
+    ]
+    try:
+        proc = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', errors='ignore',
+            timeout=timeout, creationflags=_creation_flags()
+        )
+    except Exception as e:
+        print(f"Error checking GOP structure: {e}")
+        return None
+    key_pts = None
+    for line in proc.stdout.splitlines():
+        parts = line.strip().split(",")
+        if len(parts) < 2:
+            continue
+        try:
+            pts = float(parts[0])
+        except ValueError:
+            continue # pts_time can be N/A
+        if "K" in parts[1]:
+            if key_pts is not None:
+                return False # Reached the next GOP without leading pictures
+            key_pts = pts
+        elif key_pts is not None and pts < key_pts:
+            return True
+    return None if key_pts is None else False
+
+def build_smart_cut_tasks(input_path, segments, output_paths, selected_track_ids=None, keyframes=None, probe=None):
+    """
+    Builds export tasks for frame-exact cuts at near stream copy speed.
+    Per segment, only the video of the partial GOPs at the head and tail is re-encoded
+    (matching the source codec parameters); the keyframe-aligned interior is stream copied.
+    The pieces are written as MPEG-TS (parameter sets in-band, so re-encoded and copied
+    pieces can follow each other), then concatenated and muxed with the other selected
+    tracks copied straight from the source.
+    Returns (tasks, None), or (None, error_msg) if smart cut is not possible for this file.
+    Open-GOP sources are refused: the copied interior must start on a keyframe that
+    decodes without the GOP before it.
+    Piece tasks are independent; each segment's mux task depends on its pieces.
+    """
+    if probe is None:
+        probe = probe_media(input_path)
+    video = primary_video_stream(probe)
+    if video is None:
+        return None, "비디오 트랙이 없습니다."
+    video_id = video.get('index')
+    if selected_track_ids is not None and video_id not in selected_track_ids:
+        return None, "비디오 트랙이 선택되지 않았습니다."
+    encoder_args = smart_cut_encoder_args(video)
+    if encoder_args is None:
+        return None, f"지원하지 않는 비디오 코덱입니다: {video.get('codec_name')}"
+    if keyframes is None:
+        keyframes = get_keyframes(input_path)
+    if not keyframes:
+        return None, "키프레임 인덱스가 없습니다 (아직 생성 중일 수 있습니다)."
+    open_gop = has_open_gop(input_path, keyframes, video_id)
+    if open_gop is None:
+        return None, "GOP 구조를 확인할 수 없습니다."
+    if open_gop:
+        return None, "열린 GOP(Open GOP) 구조의 영상은 정밀 자르기를 지원하지 않습니다."
+
+    tasks = []
+    total = len(segments)
+    key_set = set(keyframes)
+    for seg_index, ((start_ms, end_ms), output_path) in enumerate(zip(segments, output_paths)):
+        piece_files = []
+        piece_durations = []
+        piece_tasks = []
+        for piece_index, (kind, piece_start, piece_end) in enumerate(plan_smart_cut(keyframes, start_ms, end_ms)):
+            piece_path = f"{output_path}.smartcut{piece_index}.ts"
+            # Keyframe times are rounded up to the µs, so the keyframe itself lies within
+            # KEYFRAME_EPSILON_MS before the stored value. A copy seek to the stored value starts
+            # on it; a piece ending at it (-to is exclusive) or an encode starting at it
+            # (accurate seek drops earlier frames) uses the value just before, so no frame is
+            # written twice or lost at a join.
+            seek_start = piece_start
+            if kind == "encode" and piece_start in key_set:
+                seek_start = piece_start - KEYFRAME_EPSILON_MS
+            seek_end = piece_end - KEYFRAME_EPSILON_MS if piece_end in key_set else piece_end
+            cmd = [
+                "ffmpeg", "-y",
+                "-ss", format_time_ffmpeg(seek_start),
+                "-to", format_time_ffmpeg(seek_end),
+                "-i", input_path,
+                "-map", f"0:{video_id}",
+            ]
+            if kind == "encode":
+                cmd.extend(encoder_args + ["-fps_mode", "passthrough"])
+                desc = f"경계 구간 재인코딩 중... ({seg_index+1}/{total})"
+            else:
+                cmd.extend(["-c:v", "copy"])
+                desc = f"내부 구간 복사 중... ({seg_index+1}/{total})"
+            cmd.extend(["-f", "mpegts", piece_path])
+            piece_files.append(piece_path)
+            piece_durations.append(piece_end - piece_start)
+            piece_tasks.append(len(tasks))
+            tasks.append({
+                'cmd': cmd,
+                'desc': desc,
+                'duration_ms': max(0, piece_end - piece_start),
+                'output': piece_path
+            })
+
+        list_file_path = output_path + ".smartcut.txt"
+        try:
+            with open(list_file_path, 'w', encoding='utf-8') as f:
+                for piece_path, piece_duration in zip(piece_files, piece_durations):
+                    safe_path = piece_path.replace("\\", "/").replace("'", "'\\''")
+                    f.write(f"file '{safe_path}'\n")
+                    # Exact piece length, so concat doesn't guess it from MPEG-TS timestamps
+                    f.write(f"duration {piece_duration / 1000.0:.6f}\n")
+        except Exception as e:
+            return None, f"Failed to create concat list file: {e}"
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-f", "concat", "-safe", "0", "-i", list_file_path,
+            "-ss", format_time_ffmpeg(start_ms),
+            "-to", format_time_ffmpeg(end_ms),
+            "-i", input_path,
+            "-map", "0:v:0"
+        ]
+        # Audio/subtitle packets are all keyframes, so they are copied from the source directly
+        if selected_track_ids is not None:
+            for track_id in selected_track_ids:
+                if track_id != video_id:
+                    cmd.extend(["-map", f"1:{track_id}"])
+        else:
+            cmd.extend(["-map", "1", "-map", f"-1:{video_id}"])
+        cmd.extend(["-c", "copy", output_path])
+        tasks.append({
+            'cmd': cmd,
+            'desc': f"스마트 컷 조각 합치는 중... ({seg_index+1}/{total})",
+            'duration_ms': max(0, end_ms - start_ms),
+            'cleanup_file': list_file_path,
+            'cleanup_files': piece_files,
+            'output': output_path,
+            'depends_on': piece_tasks
+        })
+
+    return tasks, None
+
 def build_merge_cmd(input_files, output_path):
     """
     Builds the ffmpeg command for merging multiple video files.
@@ -112,3 +773,207 @@ def build_merge_cmd(input_files, output_path):
     ]
 
     return cmd, list_file_path
+
+def build_cut_merge_cmd(input_path, segments, output_path, selected_track_ids=None, keyframes=None):
+    """
+    Builds the ffmpeg command that cuts several segments of one file and merges them
+    directly into output_path, without temporary part files.
+    Uses a concat list with inpoint/outpoint directives pointing at the original file,
+    so every byte of the result is written exactly once.
+    Returns (cmd_list, list_file_path) or (None, error_msg).
+    """
+    if not segments:
+        return None, "No segments provided for merging."
+    if keyframes:
+        segments = [snap_segment(keyframes, s, e) for s, e in segments]
+
+    list_file_path = output_path + ".txt"
+    safe_path = input_path.replace("\\", "/").replace("'", "'\\''")
+    try:
+        with open(list_file_path, 'w', encoding='utf-8') as f:
+            for start_ms, end_ms in segments:
+                f.write(f"file '{safe_path}'\n")
+                f.write(f"inpoint {start_ms / 1000.0:.3f}\n")
+                f.write(f"outpoint {end_ms / 1000.0:.3f}\n")
+    except Exception as e:
+        return None, f"Failed to create concat list file: {e}"
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", list_file_path,
+        "-c", "copy"
+    ]
+
+    if selected_track_ids is not None:
+        for track_id in selected_track_ids:
+            cmd.extend(["-map", f"0:{track_id}"])
+    else:
+        cmd.extend(["-map", "0"])
+
+    cmd.append(output_path)
+    return cmd, list_file_path
+
+def part_output_paths(output_path, count, temporary=False):
+    """
+    Returns the per-segment output names derived from output_path:
+    name_1.ext, name_2.ext, ... or name_temp_part1.ext, ... for parts that are merged afterwards.
+    """
+    output_dir = os.path.dirname(output_path)
+    output_base, output_ext = os.path.splitext(os.path.basename(output_path))
+    suffix = "_temp_part" if temporary else "_"
+    return [os.path.join(output_dir, f"{output_base}{suffix}{i+1}{output_ext}") for i in range(count)]
+
+def build_export_tasks(input_path, segments, output_path, selected_track_ids=None, merge=False,
+                       keyframes=None, smart_cut=False, direct_merge=True, single_pass=False,
+                       resumable=False):
+    """
+    Turns one cut/extract job into TaskRunner tasks. Shared by the GUI and the command line.
+    segments: list of (start_ms, end_ms); a single (0, duration) segment extracts whole tracks.
+    With several segments, merge=False writes name_1.ext, name_2.ext, ... next to output_path,
+    one input-seeked cut per segment; single_pass=True writes them all from one ffmpeg
+    instead, but only when every (snapped) start is a known keyframe.
+    Direct merges are a single task, so an export journal resumes them by redoing the merge.
+    resumable=True instead builds one task per segment (plus a concat step for merges),
+    overriding direct_merge and single_pass: twice the disk space for the part files,
+    but a resumed export only redoes the interrupted segments.
+    Returns (tasks, temp_files, message): temp_files are the intermediate parts to delete once
+    the merge succeeded, message is a warning (e.g. smart cut fell back to a keyframe cut).
+    On error returns (None, [], error_msg).
+    """
+    segments = list(segments)
+    if not segments:
+        return None, [], "No segments provided."
+    total = len(segments)
+    do_merge = merge and total > 1
+    tasks = []
+    message = None
+
+    if smart_cut:
+        # Frame-exact: re-encode only the boundary GOPs, copy the rest
+        if do_merge:
+            part_outputs = part_output_paths(output_path, total, temporary=True)
+        elif total > 1:
+            part_outputs = part_output_paths(output_path, total)
+        else:
+            part_outputs = [output_path]
+        smart_tasks, error = build_smart_cut_tasks(input_path, segments, part_outputs, selected_track_ids, keyframes=keyframes)
+        if smart_tasks:
+            tasks.extend(smart_tasks)
+            if not do_merge:
+                return tasks, [], None
+            merge_cmd, lst_file = build_merge_cmd(part_outputs, output_path)
+            if not merge_cmd:
+                return None, [], lst_file
+            tasks.append({
+                'cmd': merge_cmd,
+                'desc': "조각 파일 묶음 병합 중...",
+                'duration_ms': 100,
+                'cleanup_file': lst_file,
+                'output': output_path,
+                'depends_on': list(range(len(tasks)))
+            })
+            return tasks, part_outputs, None
+        message = f"{error}\n키프레임 기준 일반 자르기로 진행합니다."
+
+    if keyframes:
+        # Snap to the keyframe stream copy really starts at
+        segments = [snap_segment(keyframes, s, e) for s, e in segments]
+
+    if total > 1 and not do_merge and single_pass and not resumable and single_pass_safe(keyframes, segments):
+        # Single pass: one ffmpeg demuxes the source once and writes every segment
+        generated_files = part_output_paths(output_path, total)
+        cmd = build_multi_cut_cmd(input_path, segments, generated_files, selected_track_ids)
+        span_ms = max(e for s, e in segments) - min(s for s, e in segments)
+        tasks.append({
+            'cmd': cmd,
+            'desc': f"구간 {total}개 한 번에 내보내기 중...",
+            'duration_ms': max(0, span_ms),
+            'outputs': generated_files
+        })
+        return tasks, [], message
+
+    if do_merge and direct_merge and not resumable:
+        # Cut and merge in one pass: concat list with inpoint/outpoint on the source, no part files
+        merge_cmd, lst_file = build_cut_merge_cmd(input_path, segments, output_path, selected_track_ids)
+        if not merge_cmd:
+            return None, [], lst_file
+        tasks.append({
+            'cmd': merge_cmd,
+            'desc': f"구간 {total}개 바로 병합 중...",
+            'duration_ms': sum(max(0, e - s) for s, e in segments),
+            'cleanup_file': lst_file,
+            'output': output_path
+        })
+        return tasks, [], message
+
+    if do_merge:
+        part_outputs = part_output_paths(output_path, total, temporary=True)
+    elif total > 1:
+        part_outputs = part_output_paths(output_path, total)
+    else:
+        part_outputs = [output_path]
+    for i, (start_ms, end_ms) in enumerate(segments):
+        current_output = part_outputs[i]
+        cmd = build_cut_cmd(input_path, start_ms, end_ms, current_output, selected_track_ids)
+        tasks.append({
+            'cmd': cmd,
+            'desc': f"구간 내보내기 중... ({i+1}/{total})",
+            'duration_ms': max(0, end_ms - start_ms),
+            'output': current_output
+        })
+
+    if not do_merge:
+        return tasks, [], message
+
+    merge_cmd, lst_file = build_merge_cmd(part_outputs, output_path)
+    if not merge_cmd:
+        return None, [], lst_file
+    tasks.append({
+        'cmd': merge_cmd,
+        'desc': "조각 파일 묶음 병합 중...",
+        'duration_ms': 100, # Small padding for merge time
+        'cleanup_file': lst_file,
+        'output': output_path,
+        'depends_on': list(range(len(tasks))) # Runs only after every part succeeded
+    })
+    return tasks, part_outputs, message
+
+def build_merge_tasks(input_files, output_path):
+    """
+    Turns a multi-file merge into TaskRunner tasks.
+    Returns (tasks, None) or (None, error_msg).
+    """
+    cmd, lst_file = build_merge_cmd(input_files, output_path)
+    if not cmd:
+        return None, lst_file
+    return [{'cmd': cmd, 'desc': "다중 파일 병합 중...", 'duration_ms': 0, 'cleanup_file': lst_file, 'output': output_path}], None
+
+def parse_time_ms(value):
+    """
+    Parses a time given as seconds (number), "[HH:]MM:SS[.mmm]" or "<n>ms".
+    Returns milliseconds. Raises ValueError on bad or negative input.
+    """
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid time: {value}")
+    if isinstance(value, (int, float)):
+        if not value >= 0 or value == float("inf"):
+            raise ValueError(f"Invalid time: {value}")
+        return int(round(value * 1000))
+    text = str(value).strip()
+    if text.startswith("-"):
+        raise ValueError(f"Negative time: {value}")
+    if text.endswith("ms"):
+        return int(text[:-2])
+    parts = text.split(":")
+    if len(parts) > 3 or not all(parts):
+        raise ValueError(f"Invalid time: {value}")
+    seconds = 0.0
+    for part in parts:
+        component = float(part)
+        if not 0 <= component < float("inf") or part.strip().startswith("-"):
+            raise ValueError(f"Invalid time: {value}")
+        seconds = seconds * 60 + component
+    return int(round(seconds * 1000))